@@ -16,8 +16,32 @@ Author: Generated with AI assistance
 """
 
 import maya.cmds as cmds
+import maya.mel as mel
+import maya.utils
+import maya.api.OpenMaya as om
+import functools
 import json
+import logging
 import os
+import threading
+import traceback
+
+try:
+    import orjson  # Optional C JSON library - much faster on large control mappings
+except ImportError:
+    orjson = None
+
+
+# Transform/visibility channels handled by constraints, never blended as custom attributes
+STANDARD_ATTRS = frozenset(('tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'sx', 'sy', 'sz', 'v'))
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=8192)
+def short_name(name):
+    """Strip namespace and DAG path from a node name ('ns:grp|ns:ctrl' -> 'ctrl')."""
+    return name.rsplit(':', 1)[-1].rsplit('|', 1)[-1]
 
 
 class DriverRig:
@@ -28,14 +52,23 @@ class DriverRig:
         self.weight = weight
         self.muted = False
         self.controls = []
+        self.short_map = {}
         self.namespace = ""
         
         # Extract controls from set
         if cmds.objExists(control_set):
-            self.controls = sorted(cmds.sets(control_set, q=True) or [], key=str.lower)
-            # Detect namespace from first control
-            if self.controls and ':' in self.controls[0]:
-                self.namespace = self.controls[0].split(':')[0]
+            self.controls = cmds.sets(control_set, q=True) or []
+            # Short name -> full control name. Set order is arbitrary, so clashes go to the
+            # case-insensitively first control, as they did when controls were sorted
+            for ctrl in self.controls:
+                ctrl_name = short_name(ctrl)
+                current = self.short_map.get(ctrl_name)
+                if current is None or ctrl.lower() < current.lower():
+                    self.short_map[ctrl_name] = ctrl
+            # Detect namespace from the case-insensitively first control
+            first_ctrl = min(self.controls, key=str.lower, default="")
+            if ':' in first_ctrl:
+                self.namespace = first_ctrl.split(':')[0]
 
 
 class TargetRig:
@@ -44,12 +77,16 @@ class TargetRig:
     def __init__(self, control_set):
         self.control_set = control_set
         self.controls = []
+        self.short_map_inv = {}
         self.namespace = ""
         
         if cmds.objExists(control_set):
-            self.controls = sorted(cmds.sets(control_set, q=True) or [], key=str.lower)
-            if self.controls and ':' in self.controls[0]:
-                self.namespace = self.controls[0].split(':')[0]
+            self.controls = cmds.sets(control_set, q=True) or []
+            # Full control name -> short name lookup
+            self.short_map_inv = {c: short_name(c) for c in self.controls}
+            first_ctrl = min(self.controls, key=str.lower, default="")
+            if ':' in first_ctrl:
+                self.namespace = first_ctrl.split(':')[0]
 
 
 class RigConnector:
@@ -62,9 +99,18 @@ class RigConnector:
         self.normalize_weights = True
         self.use_constraints = True
         self.control_mapping = {}  # {target_ctrl: [driver1_ctrl, driver2_ctrl, ...]}
-        self.constraint_nodes = []
-        self.blend_nodes = []
+        self.constraint_nodes = set()
+        self.blend_nodes = set()
         self.blacklist_attrs = []  # Attributes to skip
+        self._excluded_attrs = STANDARD_ATTRS  # Channels driven by constraints, never blended
+        self._skip_attrs = None  # Excluded + blacklisted attrs, None when stale
+        self._blended_attrs = None  # Custom attrs given a blend node by connect_rigs, None if unknown
+        self._custom_attrs_cache = {}  # {target_ctrl: {custom attrs}}
+        self._rc_constraints_by_target = {}  # {target_ctrl: {constraint nodes}}
+        self._ctrl_to_driver_idx = None  # {driver_ctrl: driver index}, None when stale
+        self._weight_attr_names = None  # ["locator.driver_N_weight", ...] per driver index, None when stale
+        self._pending_connections = None  # [(src plug, dst plug)] queued while connect_rigs batches connections
+        self.sweep_on_cleanup = False  # Also search the scene for untracked rig_connector nodes
         
     def set_target(self, control_set):
         """Set the target rig."""
@@ -76,6 +122,8 @@ class RigConnector:
         driver = DriverRig(control_set, weight)
         if len(driver.controls) > 0:
             self.drivers.append(driver)
+            self._ctrl_to_driver_idx = None
+            self._weight_attr_names = None
             return True
         return False
     
@@ -83,43 +131,41 @@ class RigConnector:
         """Remove a driver rig by index."""
         if 0 <= index < len(self.drivers):
             del self.drivers[index]
+            self._ctrl_to_driver_idx = None
+            self._weight_attr_names = None
             return True
         return False
     
+    def clear_drivers(self):
+        """Remove all driver rigs."""
+        self.drivers = []
+        self._ctrl_to_driver_idx = None
+        self._weight_attr_names = None
+    
+    def set_control_locator(self, locator):
+        """Set the blend control locator (None when there is none)."""
+        self.control_locator = locator
+        self._weight_attr_names = None
+    
     def auto_match_controls(self):
         """Automatically match controls by name (strips namespace)."""
         if not self.target or not self.drivers:
             return
         
-        self.control_mapping = {}
-        
-        # Strip namespaces for comparison
-        def strip_ns(name):
-            return name.split(':')[-1].split('|')[-1]
-        
-        for target_ctrl in self.target.controls:
-            target_name = strip_ns(target_ctrl)
-            self.control_mapping[target_ctrl] = []
-            
-            # Try to find matching control in each driver
-            for driver in self.drivers:
-                matched = False
-                for driver_ctrl in driver.controls:
-                    if strip_ns(driver_ctrl) == target_name:
-                        self.control_mapping[target_ctrl].append(driver_ctrl)
-                        matched = True
-                        break
-                
-                # If no match found, append None
-                if not matched:
-                    self.control_mapping[target_ctrl].append(None)
+        # Match on namespace-stripped names: one dict probe per (target, driver),
+        # giving the matching control in each driver, or None if no match found
+        driver_maps = [driver.short_map for driver in self.drivers]
+        self.control_mapping = {
+            target_ctrl: [driver_map.get(target_name) for driver_map in driver_maps]
+            for target_ctrl, target_name in self.target.short_map_inv.items()
+        }
     
     def create_blend_controller(self):
         """Create the main blend control locator with weight attributes."""
         if cmds.objExists("rig_connector_CTRL"):
             cmds.delete("rig_connector_CTRL")
         
-        self.control_locator = cmds.spaceLocator(name="rig_connector_CTRL")[0]
+        self.set_control_locator(cmds.spaceLocator(name="rig_connector_CTRL")[0])
         
         # Lock and hide transform attributes
         for attr in ["tx", "ty", "tz", "rx", "ry", "rz", "sx", "sy", "sz", "v"]:
@@ -185,87 +231,122 @@ class RigConnector:
             cmds.warning("Target or drivers not set")
             return False
         
-        # Auto-match controls if mapping is empty
-        if not self.control_mapping:
-            self.auto_match_controls()
-        
-        # Create blend controller
-        self.create_blend_controller()
-        
-        # Clear tracking lists
-        self.constraint_nodes = []
-        self.blend_nodes = []
-        
-        print(f"\n=== Connecting {len(self.drivers)} driver(s) to target ===")
-        
-        # Process each target control
-        for target_ctrl in self.target.controls:
-            driver_ctrls = self.control_mapping.get(target_ctrl, [])
+        # Skip undo recording and viewport refresh while building the graph
+        undo_state = cmds.undoInfo(query=True, state=True)
+        if undo_state:
+            cmds.undoInfo(stateWithoutFlush=False)
+        cmds.refresh(suspend=True)
+        try:
+            # Auto-match controls if mapping is empty
+            if not self.control_mapping:
+                self.auto_match_controls()
             
-            # Skip if no drivers mapped
-            if not any(driver_ctrls):
-                continue
+            # Drivers are final from here on - index their controls
+            self._build_driver_index()
             
-            # Filter out None values
-            valid_drivers = [ctrl for ctrl in driver_ctrls if ctrl is not None]
+            # Create blend controller
+            self.create_blend_controller()
+            self._build_weight_attr_names()
             
-            if not valid_drivers:
-                continue
+            # Clear tracking sets
+            self.constraint_nodes = set()
+            self.blend_nodes = set()
+            self._custom_attrs_cache = {}
+            self._skip_attrs = self._excluded_attrs | set(self.blacklist_attrs)
+            self._blended_attrs = set()
+            self._rc_constraints_by_target = {}
             
-            # Create constraints for translate/rotate if enabled
-            if self.use_constraints:
-                self._create_constraints_for_control(target_ctrl, valid_drivers)
+            print(f"\n=== Connecting {len(self.drivers)} driver(s) to target ===")
             
-            # Create blend nodes for custom attributes
-            self._create_blend_connections_for_control(target_ctrl, valid_drivers)
-        
-        print(f"✓ Created {len(self.constraint_nodes)} constraints")
-        print(f"✓ Created {len(self.blend_nodes)} blend nodes")
-        
-        # Connect visibility toggles to Geometry nodes
-        self._connect_visibility_toggles()
-        
-        # Select target rig top node
-        self._select_target_rig()
-        
-        return True
+            # Queue weight/input connections for every control and make them in one go below
+            self._pending_connections = []
+            
+            # Process each target control
+            for target_ctrl in self.target.controls:
+                driver_ctrls = self.control_mapping.get(target_ctrl, [])
+                
+                # Skip if no drivers mapped
+                if not any(driver_ctrls):
+                    continue
+                
+                # Filter out None values
+                valid_drivers = [ctrl for ctrl in driver_ctrls if ctrl is not None]
+                
+                if not valid_drivers:
+                    continue
+                
+                # Create constraints for translate/rotate if enabled
+                if self.use_constraints:
+                    self._create_constraints_for_control(target_ctrl, valid_drivers)
+                
+                # Create blend nodes for custom attributes
+                self._create_blend_connections_for_control(target_ctrl, valid_drivers)
+            
+            self._flush_connections()
+            
+            print(f"✓ Created {len(self.constraint_nodes)} constraints")
+            print(f"✓ Created {len(self.blend_nodes)} blend nodes")
+            
+            # Connect visibility toggles to Geometry nodes
+            self._connect_visibility_toggles()
+            
+            # Select target rig top node
+            self._select_target_rig()
+            
+            return True
+        finally:
+            self._pending_connections = None
+            cmds.refresh(suspend=False)
+            if undo_state:
+                cmds.undoInfo(stateWithoutFlush=True)
     
     def _create_constraints_for_control(self, target_ctrl, driver_ctrls):
         """Create point and orient constraints for a control."""
         try:
+            # Short names are needed for both constraints - compute them once
+            target_short = short_name(target_ctrl)
+            driver_shorts = [short_name(driver_ctrl) for driver_ctrl in driver_ctrls]
+            
             # Point constraint for translation
             point_constraint = cmds.pointConstraint(
                 driver_ctrls,
                 target_ctrl,
                 maintainOffset=True,
-                name=f"pointConstraint_rig_connector_{target_ctrl.split(':')[-1].split('|')[-1]}"
+                name=f"pointConstraint_rig_connector_{target_short}"
             )[0]
-            self.constraint_nodes.append(point_constraint)
+            self.constraint_nodes.add(point_constraint)
+            self._rc_constraints_by_target.setdefault(target_ctrl, set()).add(point_constraint)
             
-            # Connect weight attributes
-            for i, driver_ctrl in enumerate(driver_ctrls):
+            weight_plugs = self._get_weight_attr_names()
+            
+            # Connect weight attributes - before the orient constraint, which fails on locked rotates
+            weight_connections = []
+            for i, (driver_ctrl, driver_short) in enumerate(zip(driver_ctrls, driver_shorts)):
                 driver_index = self._get_driver_index_for_control(driver_ctrl)
                 if driver_index is not None:
-                    weight_attr = f"driver_{driver_index+1}_weight"
-                    target_attr = f"{point_constraint}.{driver_ctrl.split(':')[-1].split('|')[-1]}W{i}"
-                    cmds.connectAttr(f"{self.control_locator}.{weight_attr}", target_attr, force=True)
+                    target_attr = f"{point_constraint}.{driver_short}W{i}"
+                    weight_connections.append((weight_plugs[driver_index], target_attr))
+            self._connect_plugs(weight_connections)
             
             # Orient constraint for rotation
             orient_constraint = cmds.orientConstraint(
                 driver_ctrls,
                 target_ctrl,
                 maintainOffset=True,
-                name=f"orientConstraint_rig_connector_{target_ctrl.split(':')[-1].split('|')[-1]}"
+                name=f"orientConstraint_rig_connector_{target_short}"
             )[0]
-            self.constraint_nodes.append(orient_constraint)
+            self.constraint_nodes.add(orient_constraint)
+            self._rc_constraints_by_target.setdefault(target_ctrl, set()).add(orient_constraint)
             
             # Connect weight attributes
-            for i, driver_ctrl in enumerate(driver_ctrls):
+            weight_connections = []
+            for i, (driver_ctrl, driver_short) in enumerate(zip(driver_ctrls, driver_shorts)):
                 driver_index = self._get_driver_index_for_control(driver_ctrl)
                 if driver_index is not None:
-                    weight_attr = f"driver_{driver_index+1}_weight"
-                    target_attr = f"{orient_constraint}.{driver_ctrl.split(':')[-1].split('|')[-1]}W{i}"
-                    cmds.connectAttr(f"{self.control_locator}.{weight_attr}", target_attr, force=True)
+                    target_attr = f"{orient_constraint}.{driver_short}W{i}"
+                    weight_connections.append((weight_plugs[driver_index], target_attr))
+            
+            self._connect_plugs(weight_connections)
         
         except Exception as e:
             print(f"Warning: Could not constrain {target_ctrl}: {e}")
@@ -277,57 +358,127 @@ class RigConnector:
             keyable_attrs = cmds.listAttr(target_ctrl, keyable=True, unlocked=True, visible=True) or []
             
             # Filter out translate, rotate, scale, visibility
-            standard_attrs = ['tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'sx', 'sy', 'sz', 'v']
-            custom_attrs = [attr for attr in keyable_attrs if attr not in standard_attrs and attr not in self.blacklist_attrs]
+            if self._skip_attrs is None:
+                self._skip_attrs = self._excluded_attrs | set(self.blacklist_attrs)
+            custom_attrs = [attr for attr in keyable_attrs if attr not in self._skip_attrs]
+            
+            # Seed the per-control cache used when a mapping is removed and reapplied
+            if target_ctrl not in self._custom_attrs_cache:
+                self._custom_attrs_cache[target_ctrl] = {attr for attr in keyable_attrs if attr not in self._excluded_attrs}
             
             if not custom_attrs:
                 return
             
+            # Keyable attributes of each driver, listed once instead of queried per attribute
+            driver_attrs = {driver_ctrl: set(cmds.listAttr(driver_ctrl, keyable=True) or []) for driver_ctrl in driver_ctrls}
+            
+            weight_plugs = self._get_weight_attr_names()
+            
             # Process each custom attribute
             for attr in custom_attrs:
-                # Create multiply nodes for each driver
-                multiply_nodes = []
+                # Drivers that actually have this attribute
+                sources = [driver_ctrl for driver_ctrl in driver_ctrls if attr in driver_attrs[driver_ctrl]]
+                if not sources:
+                    continue
                 
-                for i, driver_ctrl in enumerate(driver_ctrls):
-                    # Check if driver has this attribute
-                    if not cmds.attributeQuery(attr, node=driver_ctrl, exists=True):
-                        continue
-                    
-                    # Create multiply node
-                    mult_node = cmds.createNode('multiplyDivide', name=f"mult_rig_connector_{attr}")
-                    multiply_nodes.append(mult_node)
-                    self.blend_nodes.append(mult_node)
-                    
-                    # Connect driver attribute to multiply
-                    cmds.connectAttr(f"{driver_ctrl}.{attr}", f"{mult_node}.input1X", force=True)
+                # One blendWeighted node sums every weighted driver input
+                blend_node = cmds.createNode('blendWeighted', name=f"blend_rig_connector_{attr}")
+                self.blend_nodes.add(blend_node)
+                if self._blended_attrs is not None:
+                    self._blended_attrs.add(attr)
+                
+                # Driver and weight inputs - batched while connect_rigs runs
+                input_connections = []
+                for i, driver_ctrl in enumerate(sources):
+                    # Connect driver attribute to blend input
+                    input_connections.append((f"{driver_ctrl}.{attr}", f"{blend_node}.input[{i}]"))
                     
-                    # Connect weight to multiply
+                    # Connect weight to blend weight
                     driver_index = self._get_driver_index_for_control(driver_ctrl)
                     if driver_index is not None:
-                        weight_attr = f"driver_{driver_index+1}_weight"
-                        cmds.connectAttr(f"{self.control_locator}.{weight_attr}", f"{mult_node}.input2X", force=True)
+                        input_connections.append((weight_plugs[driver_index], f"{blend_node}.weight[{i}]"))
                 
-                # If we have multiply nodes, create plusMinusAverage to sum them
-                if multiply_nodes:
-                    plus_node = cmds.createNode('plusMinusAverage', name=f"plus_rig_connector_{attr}")
-                    self.blend_nodes.append(plus_node)
-                    
-                    # Connect all multiply outputs to plus node
-                    for i, mult_node in enumerate(multiply_nodes):
-                        cmds.connectAttr(f"{mult_node}.outputX", f"{plus_node}.input1D[{i}]", force=True)
-                    
-                    # Connect plus output to target
-                    cmds.connectAttr(f"{plus_node}.output1D", f"{target_ctrl}.{attr}", force=True)
+                # Inputs go first, so a failure further on never leaves this node driving its attr from nothing
+                self._connect_plugs(input_connections)
+                
+                # Connect blend output to target (forced - the target attr may already be keyed)
+                cmds.connectAttr(f"{blend_node}.output", f"{target_ctrl}.{attr}", force=True)
         
         except Exception as e:
             print(f"Warning: Could not blend attributes for {target_ctrl}: {e}")
     
+    def _connect_plugs(self, connections):
+        """Connect (src, dst) plug pairs, or queue them while connect_rigs is batching."""
+        if not connections:
+            return
+        
+        if self._pending_connections is not None:
+            self._pending_connections.extend(connections)
+            return
+        
+        # One MEL evaluation instead of a Python -> command engine round trip per connection
+        mel.eval("".join(f'connectAttr -f "{src}" "{dst}";' for src, dst in connections))
+    
+    def _flush_connections(self):
+        """Make all queued connections with a single MDGModifier."""
+        pending, self._pending_connections = self._pending_connections, None
+        if not pending:
+            return
+        
+        modifier = om.MDGModifier()
+        try:
+            for src, dst in pending:
+                plugs = om.MSelectionList()
+                plugs.add(src)
+                plugs.add(dst)
+                modifier.connect(plugs.getPlug(0), plugs.getPlug(1))
+        except Exception as e:
+            # A bad plug name - nothing has been applied yet
+            print(f"Warning: Batched connect failed ({e}), connecting individually")
+            self._connect_individually(pending)
+            return
+        
+        try:
+            modifier.doIt()
+        except Exception as e:
+            # One plug that can't be connected fails the whole modifier - roll back what it did
+            print(f"Warning: Batched connect failed ({e}), connecting individually")
+            try:
+                modifier.undoIt()
+            except Exception as undo_error:
+                print(f"Warning: Could not undo batched connect: {undo_error}")
+            self._connect_individually(pending)
+    
+    def _connect_individually(self, connections):
+        """Connect plug pairs one by one so a single failure stays local to its plug."""
+        for src, dst in connections:
+            try:
+                cmds.connectAttr(src, dst, force=True)
+            except Exception as e:
+                print(f"Warning: Could not connect {src} -> {dst}: {e}")
+    
+    def _build_driver_index(self):
+        """Map every driver control to the index of the first driver that owns it."""
+        self._ctrl_to_driver_idx = {}
+        for i, driver in enumerate(self.drivers):
+            for ctrl in driver.controls:
+                self._ctrl_to_driver_idx.setdefault(ctrl, i)
+    
     def _get_driver_index_for_control(self, driver_ctrl):
         """Get the driver index that owns this control."""
-        for i, driver in enumerate(self.drivers):
-            if driver_ctrl in driver.controls:
-                return i
-        return None
+        if self._ctrl_to_driver_idx is None:
+            self._build_driver_index()
+        return self._ctrl_to_driver_idx.get(driver_ctrl)
+    
+    def _build_weight_attr_names(self):
+        """Format each driver's weight plug on the control locator once."""
+        self._weight_attr_names = [f"{self.control_locator}.driver_{i+1}_weight" for i in range(len(self.drivers))]
+    
+    def _get_weight_attr_names(self):
+        """Get the weight plugs, rebuilding them if the drivers or locator changed."""
+        if self._weight_attr_names is None:
+            self._build_weight_attr_names()
+        return self._weight_attr_names
     
     def _connect_visibility_toggles(self):
         """Connect visibility attributes to Geometry nodes for each rig."""
@@ -387,14 +538,17 @@ class RigConnector:
         print(f"✓ Selected blend controller: {self.control_locator}")
     
     def solo_driver(self, index):
-        """Solo a driver (set its weight to 1.0, others to 0.0)."""
+        """Solo a driver (set its weight to 1.0, others to 0.0). Returns True if applied."""
         if not self.control_locator:
-            return
+            return False
         
-        for i in range(len(self.drivers)):
+        # Every other driver is now effectively muted
+        for i, driver in enumerate(self.drivers):
             weight_attr = f"driver_{i+1}_weight"
             value = 1.0 if i == index else 0.0
             cmds.setAttr(f"{self.control_locator}.{weight_attr}", value)
+            driver.muted = i != index
+        return True
     
     def mute_driver(self, index, mute=True):
         """Mute/unmute a driver."""
@@ -442,67 +596,73 @@ class RigConnector:
                             print(f"Warning: {e}")
         
         # Disconnect and delete constraints - store transforms first to prevent jumping
-        for constraint in self.constraint_nodes:
+        constraints_to_delete = self._existing_nodes(self.constraint_nodes)
+        stored_values = {}  # {constrained control: {attr: value}} - one entry per control
+        for constraint in constraints_to_delete:
             try:
-                if cmds.objExists(constraint):
-                    # Get the constrained object
-                    constrained = cmds.listConnections(constraint, type='transform', destination=True)
-                    if constrained and len(constrained) > 0:
-                        target = constrained[0]
-                        
-                        # Store current transform values
-                        stored_values = {}
-                        for attr in ['tx', 'ty', 'tz', 'rx', 'ry', 'rz']:
-                            try:
-                                if cmds.getAttr(f"{target}.{attr}", settable=True):
-                                    stored_values[attr] = cmds.getAttr(f"{target}.{attr}")
-                            except:
-                                pass
-                        
-                        # Delete constraint
-                        cmds.delete(constraint)
-                        
-                        # Restore transform values to prevent jumping
-                        for attr, value in stored_values.items():
-                            try:
-                                if cmds.getAttr(f"{target}.{attr}", settable=True):
-                                    cmds.setAttr(f"{target}.{attr}", value)
-                            except:
-                                pass
+                # Get the constrained object
+                constrained = cmds.listConnections(constraint, type='transform', destination=True)
+                if constrained and len(constrained) > 0:
+                    target = constrained[0]
+                    
+                    # Point and orient constraints share a control - store its values once
+                    if target in stored_values:
+                        continue
+                    
+                    # Store current transform values
+                    values = stored_values[target] = {}
+                    for attr in ['tx', 'ty', 'tz', 'rx', 'ry', 'rz']:
+                        try:
+                            if cmds.getAttr(f"{target}.{attr}", settable=True):
+                                values[attr] = cmds.getAttr(f"{target}.{attr}")
+                        except:
+                            pass
             except Exception as e:
                 print(f"Warning cleaning constraint {constraint}: {e}")
         
-        # Disconnect and delete blend nodes - but first unlock and reset target attributes
-        for blend_node in self.blend_nodes:
+        # Delete all constraints in one call
+        self._delete_nodes(constraints_to_delete)
+        
+        # Restore transform values to prevent jumping
+        for target, values in stored_values.items():
+            for attr, value in values.items():
+                try:
+                    if cmds.getAttr(f"{target}.{attr}", settable=True):
+                        cmds.setAttr(f"{target}.{attr}", value)
+                except:
+                    pass
+        
+        # Disconnect blend nodes - but first unlock and reset target attributes
+        blend_nodes_to_delete = self._existing_nodes(self.blend_nodes)
+        for blend_node in blend_nodes_to_delete:
             try:
-                if cmds.objExists(blend_node):
-                    # Get output connections
-                    outputs = cmds.listConnections(blend_node, source=False, plugs=True, destination=True) or []
-                    
-                    # For each output, store the current value, disconnect, then restore
-                    for output in outputs:
-                        try:
-                            # Get current value before disconnect
-                            current_value = cmds.getAttr(output)
-                            
-                            # Find the input connection
-                            input_plugs = cmds.listConnections(output, source=True, plugs=True, destination=False) or []
-                            
-                            # Disconnect
-                            for input_plug in input_plugs:
-                                if 'rig_connector' in input_plug:
-                                    cmds.disconnectAttr(input_plug, output)
-                            
-                            # Set back to the value it had (this prevents it from jumping)
-                            cmds.setAttr(output, current_value)
-                        except Exception as e:
-                            print(f"  Warning disconnecting {output}: {e}")
-                    
-                    # Now delete the node
-                    cmds.delete(blend_node)
+                # Get output connections
+                outputs = cmds.listConnections(blend_node, source=False, plugs=True, destination=True) or []
+                
+                # For each output, store the current value, disconnect, then restore
+                for output in outputs:
+                    try:
+                        # Get current value before disconnect
+                        current_value = cmds.getAttr(output)
+                        
+                        # Find the input connection
+                        input_plugs = cmds.listConnections(output, source=True, plugs=True, destination=False) or []
+                        
+                        # Disconnect
+                        for input_plug in input_plugs:
+                            if 'rig_connector' in input_plug:
+                                cmds.disconnectAttr(input_plug, output)
+                        
+                        # Set back to the value it had (this prevents it from jumping)
+                        cmds.setAttr(output, current_value)
+                    except Exception as e:
+                        print(f"  Warning disconnecting {output}: {e}")
             except Exception as e:
                 print(f"Warning cleaning blend node {blend_node}: {e}")
         
+        # Now delete all blend nodes in one call
+        self._delete_nodes(blend_nodes_to_delete)
+        
         # Delete control locator
         if self.control_locator and cmds.objExists(self.control_locator):
             try:
@@ -510,29 +670,54 @@ class RigConnector:
             except Exception as e:
                 print(f"Warning deleting control locator: {e}")
         
-        # Find and clean any remaining rig_connector nodes
-        all_nodes = cmds.ls()
-        remaining = []
-        for node in all_nodes:
-            if 'rig_connector' in node and cmds.objExists(node):
-                try:
-                    cmds.delete(node)
-                    remaining.append(node)
-                except:
-                    pass
+        # Everything we created is tracked above - only sweep the scene for leftovers when asked to,
+        # or when nothing is tracked (e.g. the setup was built in an earlier session)
+        if self.sweep_on_cleanup or not (self.constraint_nodes or self.blend_nodes):
+            remaining = cmds.ls("*rig_connector*", recursive=True) or []
+            if remaining:
+                self._delete_nodes(remaining)
+                print(f"✓ Cleaned up {len(remaining)} remaining nodes")
+        
+        # Clear tracking sets
+        self.constraint_nodes = set()
+        self.blend_nodes = set()
+        self._custom_attrs_cache = {}
+        self._blended_attrs = None
+        self._rc_constraints_by_target = {}
+        self.set_control_locator(None)
         
-        if remaining:
-            print(f"✓ Cleaned up {len(remaining)} remaining nodes")
+        print("✓ Cleanup complete")
+    
+    def _existing_nodes(self, nodes):
+        """Filter tracked nodes down to the ones still in the scene with a single ls call."""
+        if not nodes:
+            return []
+        return sorted(cmds.ls(list(nodes)) or [])
+    
+    def _delete_nodes(self, nodes):
+        """Delete nodes in one call, skipping duplicates and nodes that are already gone."""
+        unique_nodes = list(dict.fromkeys(nodes))
+        if not unique_nodes:
+            return
         
-        # Clear tracking lists
-        self.constraint_nodes = []
-        self.blend_nodes = []
-        self.control_locator = None
+        # ls returns only the names that exist, in one call (never pass it an empty list - that lists the scene)
+        existing = cmds.ls(unique_nodes) or []
+        if not existing:
+            return
         
-        print("✓ Cleanup complete")
+        try:
+            cmds.delete(existing)
+        except Exception:
+            # Fall back to node by node so one undeletable node doesn't block the rest
+            for node in existing:
+                try:
+                    if cmds.objExists(node):
+                        cmds.delete(node)
+                except Exception as e:
+                    print(f"Warning deleting {node}: {e}")
     
-    def bake_and_cleanup(self, bake_set=None):
-        """Bake animation to target rig and cleanup blend system."""
+    def bake_and_cleanup(self, bake_set=None, sample_by=1):
+        """Bake animation to target rig and cleanup blend system (sample_by > 1 for quick preview bakes)."""
         if not self.target:
             cmds.warning("No target rig set")
             return
@@ -547,38 +732,59 @@ class RigConnector:
             cmds.warning("No controls to bake")
             return
         
-        print(f"\n=== Baking {len(controls_to_bake)} controls ===")
-        
-        # Select controls
-        cmds.select(controls_to_bake, replace=True)
-        
-        # Get time range
-        start_frame = cmds.playbackOptions(q=True, min=True)
-        end_frame = cmds.playbackOptions(q=True, max=True)
-        
-        # Bake
-        cmds.bakeResults(
-            controls_to_bake,
-            simulation=True,
-            time=(start_frame, end_frame),
-            sampleBy=1,
-            oversamplingRate=1,
-            disableImplicitControl=True,
-            preserveOutsideKeys=True,
-            sparseAnimCurveBake=False,
-            removeBakedAttributeFromLayer=False,
-            bakeOnOverrideLayer=False,
-            minimizeRotation=True,
-            controlPoints=False,
-            shape=True
-        )
-        
-        print(f"✓ Baked animation from frame {start_frame} to {end_frame}")
-        
-        # Cleanup
-        self.cleanup()
-        
-        cmds.select(clear=True)
+        # Skip undo recording and viewport refresh while baking and deleting the setup
+        undo_state = cmds.undoInfo(query=True, state=True)
+        if undo_state:
+            cmds.undoInfo(stateWithoutFlush=False)
+        cmds.refresh(suspend=True)
+        try:
+            print(f"\n=== Baking {len(controls_to_bake)} controls ===")
+            
+            # Select controls
+            cmds.select(controls_to_bake, replace=True)
+            
+            # Get time range
+            start_frame = cmds.playbackOptions(q=True, min=True)
+            end_frame = cmds.playbackOptions(q=True, max=True)
+            
+            # Only bake channels that receive blended input - known when connect_rigs ran in this session
+            bake_kwargs = {}
+            if self._blended_attrs is not None:
+                bake_attrs = set(self._blended_attrs)
+                if self.use_constraints:
+                    bake_attrs.update(['translateX', 'translateY', 'translateZ', 'rotateX', 'rotateY', 'rotateZ'])
+                if bake_attrs:
+                    bake_kwargs['attribute'] = sorted(bake_attrs)
+            
+            # Bake
+            cmds.bakeResults(
+                controls_to_bake,
+                simulation=True,
+                time=(start_frame, end_frame),
+                sampleBy=sample_by,
+                smart=True,
+                oversamplingRate=1,
+                disableImplicitControl=True,
+                preserveOutsideKeys=True,
+                sparseAnimCurveBake=False,
+                removeBakedAttributeFromLayer=False,
+                bakeOnOverrideLayer=False,
+                minimizeRotation=True,
+                controlPoints=False,
+                shape=True,
+                **bake_kwargs
+            )
+            
+            print(f"✓ Baked animation from frame {start_frame} to {end_frame}")
+            
+            # Cleanup
+            self.cleanup()
+            
+            cmds.select(clear=True)
+        finally:
+            cmds.refresh(suspend=False)
+            if undo_state:
+                cmds.undoInfo(stateWithoutFlush=True)
     
     def save_config(self, filepath):
         """Save the current setup to a JSON file."""
@@ -592,8 +798,12 @@ class RigConnector:
             "blacklist_attrs": self.blacklist_attrs
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(config, f, indent=4)
+        if orjson:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(config, f, indent=2)
         
         print(f"✓ Saved configuration to: {filepath}")
     
@@ -603,11 +813,15 @@ class RigConnector:
             cmds.warning(f"Config file not found: {filepath}")
             return False
         
-        with open(filepath, 'r') as f:
-            config = json.load(f)
+        if orjson:
+            with open(filepath, 'rb') as f:
+                config = orjson.loads(f.read())
+        else:
+            with open(filepath, 'r') as f:
+                config = json.load(f)
         
         # Clear current setup
-        self.drivers = []
+        self.clear_drivers()
         
         # Load target
         if config.get("target"):
@@ -623,6 +837,7 @@ class RigConnector:
         self.use_constraints = config.get("use_constraints", True)
         self.control_mapping = config.get("control_mapping", {})
         self.blacklist_attrs = config.get("blacklist_attrs", [])
+        self._skip_attrs = None
         
         print(f"✓ Loaded configuration from: {filepath}")
         return True
@@ -635,6 +850,8 @@ class RigConnectorUI:
         self.connector = RigConnector()
         self.window_name = "RigConnectorProUI"
         self.driver_ui_rows = []
+        self._ctrl_set_cache = {}  # {namespace: ControlSet or None}, refreshed per load pass
+        self.verbose = False  # Print ControlSet search diagnostics
         
     def create_ui(self):
         """Build the main UI window."""
@@ -702,6 +919,15 @@ class RigConnectorUI:
         
         cmds.separator(height=10, style="none")
         
+        # Show the empty window right away and build the rows on the next idle tick
+        cmds.showWindow(self.window)
+        cmds.evalDeferred(self._finish_ui_init)
+    
+    def _finish_ui_init(self):
+        """Add the initial driver rows and fill them from the scene."""
+        if not cmds.window(self.window, exists=True):
+            return
+        
         # Add initial driver rows
         self.add_driver_row()
         self.add_driver_row()
@@ -712,8 +938,6 @@ class RigConnectorUI:
         else:
             # Auto-populate from current selection
             self.populate_from_selection()
-        
-        cmds.showWindow(self.window)
     
     def add_driver_row(self, *args):
         """Add a new driver rig row to the UI."""
@@ -765,7 +989,9 @@ class RigConnectorUI:
             'set_field': set_field,
             'weight_slider': weight_slider,
             'solo_btn': solo_btn,
-            'mute_btn': mute_btn
+            'mute_btn': mute_btn,
+            'soloed': False,
+            'muted': False
         })
     
     def remove_driver_row(self, frame, index):
@@ -777,7 +1003,8 @@ class RigConnectorUI:
     
     def load_target(self, *args):
         """Load selected control sets: first as target, rest as drivers."""
-        selection = cmds.ls(orderedSelection=True)
+        self._ctrl_set_cache = {}
+        selection, sets_in_sel = self._get_selection_and_sets()
         if not selection:
             cmds.warning("Nothing selected")
             return
@@ -786,7 +1013,7 @@ class RigConnectorUI:
         first_item = selection[0]
         
         # Check if it's already an objectSet
-        if cmds.objectType(first_item) == 'objectSet':
+        if first_item in sets_in_sel:
             target_set = first_item
         else:
             # Try to find ControlSet
@@ -807,7 +1034,7 @@ class RigConnectorUI:
             # Fill driver fields
             for i, item in enumerate(selection[1:]):
                 if i < len(self.driver_ui_rows):
-                    if cmds.objectType(item) == 'objectSet':
+                    if item in sets_in_sel:
                         driver_set = item
                     else:
                         driver_set = self._find_control_set(item)
@@ -817,15 +1044,28 @@ class RigConnectorUI:
                     else:
                         cmds.warning(f"Could not find ControlSet for driver: {item}")
     
+    def _get_selection_and_sets(self, ordered=True):
+        """Get the selection and which of its items are objectSets, in one query."""
+        # [name, type, name, type, ...]
+        if ordered:
+            names_and_types = cmds.ls(orderedSelection=True, showType=True) or []
+        else:
+            names_and_types = cmds.ls(selection=True, showType=True) or []
+        selection = names_and_types[::2]
+        sets_in_sel = {name for name, node_type in zip(selection, names_and_types[1::2]) if node_type == 'objectSet'}
+        return selection, sets_in_sel
+    
     def load_driver_set(self, field):
         """Load selected control set as driver or find it from top node."""
-        selection = cmds.ls(selection=True)
+        self._ctrl_set_cache = {}
+        # orderedSelection is empty unless trackSelectionOrder is on
+        selection, sets_in_sel = self._get_selection_and_sets(ordered=False)
         if not selection:
             cmds.warning("Nothing selected")
             return
         
         # Check if selection is already an objectSet
-        if cmds.objectType(selection[0]) == 'objectSet':
+        if selection[0] in sets_in_sel:
             cmds.textField(field, edit=True, text=selection[0])
             return
         
@@ -846,6 +1086,7 @@ class RigConnectorUI:
         
         # Clear and set target
         self.connector = RigConnector()
+        self._update_driver_buttons()
         if not self.connector.set_target(target_set):
             cmds.warning("Target rig has no controls")
             return
@@ -875,13 +1116,31 @@ class RigConnectorUI:
     
     def solo_driver(self, index):
         """Solo a driver rig."""
-        self.connector.solo_driver(index)
+        if self.connector.solo_driver(index):
+            self._update_driver_buttons(soloed_index=index)
     
     def mute_driver(self, index):
         """Toggle mute on a driver."""
         if 0 <= index < len(self.connector.drivers):
-            current_mute = self.connector.drivers[index].muted
-            self.connector.mute_driver(index, not current_mute)
+            new_state = not self.connector.drivers[index].muted
+            self.connector.mute_driver(index, new_state)
+            
+            # Changing a mute breaks any solo
+            self._update_driver_buttons()
+    
+    def _update_driver_buttons(self, soloed_index=None):
+        """Color the solo/mute buttons from the connector's driver state, editing only those that changed."""
+        drivers = self.connector.drivers
+        for i, row in enumerate(self.driver_ui_rows):
+            soloed = i == soloed_index
+            if row['soloed'] != soloed:
+                row['soloed'] = soloed
+                cmds.button(row['solo_btn'], edit=True, backgroundColor=[0.7, 0.6, 0.3] if soloed else [0.3, 0.5, 0.3])
+            
+            muted = i < len(drivers) and drivers[i].muted
+            if row['muted'] != muted:
+                row['muted'] = muted
+                cmds.button(row['mute_btn'], edit=True, backgroundColor=[0.7, 0.3, 0.3] if muted else [0.3, 0.5, 0.3])
     
     def bake_and_cleanup(self, *args):
         """Bake animation and cleanup."""
@@ -976,13 +1235,13 @@ class RigConnectorUI:
             
         except Exception as e:
             print(f"Error loading from controller: {e}")
-            import traceback
             traceback.print_exc()
     
     def populate_from_selection(self):
         """Populate fields from current selection when UI launches."""
         try:
-            selection = cmds.ls(orderedSelection=True)
+            self._ctrl_set_cache = {}
+            selection, sets_in_sel = self._get_selection_and_sets()
             if not selection:
                 print("No selection when launching UI")
                 return
@@ -993,7 +1252,7 @@ class RigConnectorUI:
             first_item = selection[0]
             
             # Check if it's already an objectSet
-            if cmds.objectType(first_item) == 'objectSet':
+            if first_item in sets_in_sel:
                 target_set = first_item
             else:
                 # Try to find ControlSet
@@ -1014,7 +1273,7 @@ class RigConnectorUI:
                 # Fill driver fields
                 for i, item in enumerate(selection[1:]):
                     if i < len(self.driver_ui_rows):
-                        if cmds.objectType(item) == 'objectSet':
+                        if item in sets_in_sel:
                             driver_set = item
                         else:
                             driver_set = self._find_control_set(item)
@@ -1024,58 +1283,84 @@ class RigConnectorUI:
                             cmds.textField(self.driver_ui_rows[i]['set_field'], edit=True, text=driver_set)
                         else:
                             print(f"Could not find ControlSet for driver: {item}")
-        except Exception as e:
-            print(f"Error in populate_from_selection: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("populate_from_selection failed")
     
     def _find_control_set(self, top_node):
         """Find ControlSet under namespace:Sets for a given top node."""
-        print(f"Searching for ControlSet from top node: {top_node}")
+        if self.verbose:
+            print(f"Searching for ControlSet from top node: {top_node}")
         
         # Get namespace from top node if it exists
         namespace = ""
         if ':' in top_node:
             namespace = top_node.split(':')[0]
-            print(f"Detected namespace: {namespace}")
+            if self.verbose:
+                print(f"Detected namespace: {namespace}")
         
+        # Rigs sharing a namespace share a ControlSet - search once per load pass
+        if namespace in self._ctrl_set_cache:
+            return self._ctrl_set_cache[namespace]
+        
+        control_set = self._ctrl_set_cache[namespace] = self._search_control_set(namespace)
+        return control_set
+    
+    def _search_control_set(self, namespace):
+        """Search the scene for the ControlSet of a namespace ("" for no namespace)."""
+        # Candidates come lazily - later, costlier stages only run if earlier ones found nothing
+        control_set = next(self._controlset_candidates(namespace), None)
+        
+        if control_set is None and self.verbose:
+            print(f"Could not find ControlSet for namespace: {namespace}")
+        return control_set
+    
+    def _controlset_candidates(self, namespace):
+        """Yield existing ControlSet objectSets for a namespace, cheapest search first."""
         # Try direct patterns first
         possible_sets = [
             f"{namespace}:ControlSet" if namespace else "ControlSet",
             f"{namespace}:controlSet" if namespace else "controlSet",
             f"{namespace}:Controls" if namespace else "Controls"
         ]
+        sets_node = f"{namespace}:Sets" if namespace else "Sets"
+        
+        # Which of the candidate names exist as objectSets - one query for all of them
+        found = set(cmds.ls(possible_sets + [sets_node], type='objectSet') or [])
         
         for set_name in possible_sets:
-            if cmds.objExists(set_name):
-                print(f"Found direct match: {set_name}")
-                return set_name
+            if set_name in found:
+                if self.verbose:
+                    print(f"Found direct match: {set_name}")
+                yield set_name
         
         # Look for ControlSet as member of Sets
-        sets_node = f"{namespace}:Sets" if namespace else "Sets"
-        if cmds.objExists(sets_node) and cmds.objectType(sets_node) == 'objectSet':
-            print(f"Found Sets node: {sets_node}, checking members...")
+        if sets_node in found:
+            if self.verbose:
+                print(f"Found Sets node: {sets_node}, checking members...")
             members = cmds.sets(sets_node, q=True) or []
+            member_sets = set(cmds.ls(members, type='objectSet') or []) if members else set()
             for member in members:
-                if cmds.objectType(member) == 'objectSet' and 'ControlSet' in member:
-                    print(f"Found ControlSet as member: {member}")
-                    return member
-        
-        # Search all sets for namespace:ControlSet pattern
-        all_sets = cmds.ls(type='objectSet')
-        print(f"Searching {len(all_sets)} objectSets for ControlSet...")
-        for s in all_sets:
-            if namespace:
-                if s.startswith(f"{namespace}:") and 'ControlSet' in s:
-                    print(f"Found matching set: {s}")
-                    return s
-            else:
-                if 'ControlSet' in s:
-                    print(f"Found matching set: {s}")
-                    return s
-        
-        print(f"Could not find ControlSet for namespace: {namespace}")
-        return None
+                if member in member_sets and 'ControlSet' in member:
+                    if self.verbose:
+                        print(f"Found ControlSet as member: {member}")
+                    yield member
+        
+        # Search for a *ControlSet* set - Maya matches the pattern, not Python
+        if namespace:
+            matches = cmds.ls(f"{namespace}:*ControlSet*", type='objectSet') or []
+            # Then sets in nested namespaces (namespace:child:...)
+            prefix = f"{namespace}:"
+            direct = set(matches)
+            matches += [
+                match for match in cmds.ls("*ControlSet*", type='objectSet', recursive=True) or []
+                if match.startswith(prefix) and match not in direct
+            ]
+        else:
+            matches = cmds.ls("*ControlSet*", type='objectSet', recursive=True) or []
+        for match in matches:
+            if self.verbose:
+                print(f"Found matching set: {match}")
+            yield match
     
     def open_mapping_ui(self, *args):
         """Open the control mapping interface."""
@@ -1098,7 +1383,7 @@ class RigConnectorUI:
         
         # Set up connector with current rigs
         self.connector.set_target(target_set)
-        self.connector.drivers = []
+        self.connector.clear_drivers()
         for driver_set in driver_sets:
             weight = 0.5
             self.connector.add_driver(driver_set, weight)
@@ -1119,7 +1404,29 @@ class ControlMappingUI:
         self.connector = connector
         self.window_name = "ControlMappingUI"
         self.mapping_rows = []
-        
+        self.search_min_length = 2  # Shorter searches show all rows
+        self.filter_delay = 0.15  # Seconds to wait after the last keystroke
+        self._filter_timer = None
+        self._last_search_text = ''  # Search applied to the current row visibility, None if unknown
+        self._name_to_drivers = {}  # {control name: [driver indices]}
+        self._picker_ctrl_name = ""  # Control offered in the row/driver picker dialog
+        self.row_height = 24  # Fixed pixel height of each mapping row
+        self.row_pool_size = 30  # Row widgets reused for the visible slice of mapping_rows
+        self.row_pool = []
+        self.visible_rows = []  # Records that pass the current filter
+        self._first_row = 0  # Index into visible_rows bound to the first pooled widget
+        self._build_driver_name_index()
+        
+    def _build_driver_name_index(self):
+        """Index driver control names (full and namespace-stripped) to driver indices."""
+        self._name_to_drivers = {}
+        for i, driver in enumerate(self.connector.drivers):
+            for names in (driver.short_map, driver.controls):
+                for name in names:
+                    indices = self._name_to_drivers.setdefault(name, [])
+                    if not indices or indices[-1] != i:
+                        indices.append(i)
+    
     def create_ui(self):
         """Build the control mapping window."""
         if cmds.window(self.window_name, exists=True):
@@ -1144,7 +1451,7 @@ class ControlMappingUI:
         # Search/Filter
         cmds.rowLayout(numberOfColumns=3, columnWidth3=(100, 650, 150))
         cmds.text(label="Search/Filter:", align="right")
-        self.search_field = cmds.textField(changeCommand=self.filter_rows, annotation="Type to filter controls")
+        self.search_field = cmds.textField(textChangedCommand=self._schedule_filter, annotation="Type to filter controls")
         cmds.button(label="Add Selection to Search", command=self.add_selection_to_search, backgroundColor=[0.4, 0.6, 0.7], annotation="Add selected control name to search field")
         cmds.setParent('..')
         cmds.separator(height=5, style="none")
@@ -1162,11 +1469,14 @@ class ControlMappingUI:
         
         cmds.separator(height=5, style="in")
         
-        # Scroll layout for mappings
-        self.mapping_scroll = cmds.scrollLayout(childResizable=True, height=400)
-        self.mapping_column = cmds.columnLayout(adjustableColumn=True, rowSpacing=2)
+        # Scroll layout for mappings - only a pool of row widgets is created,
+        # spacers above and below stand in for the rows that are scrolled out of view
+        self.mapping_scroll = cmds.scrollLayout(childResizable=True, height=400, scrollChangeCommand=self._on_scroll)
+        self.mapping_column = cmds.columnLayout(adjustableColumn=True, rowSpacing=0)
+        self.rows_parent = self.mapping_column
         
         # Build mapping rows
+        self._build_row_pool()
         self._build_mapping_rows()
         
         cmds.setParent('..')
@@ -1196,80 +1506,222 @@ class ControlMappingUI:
         
         cmds.showWindow(self.window)
     
-    def _build_mapping_rows(self):
-        """Build a row for each target control."""
+    def _build_row_pool(self):
+        """Create the reusable row widgets and the spacers around them."""
         cmds.setParent(self.mapping_column)
         
-        self.mapping_rows = []
         num_drivers = len(self.connector.drivers)
-        
-        for idx, (target_ctrl, driver_ctrls) in enumerate(self.connector.control_mapping.items()):
-            # Strip namespace for display
-            target_display = target_ctrl.split(':')[-1].split('|')[-1]
-            
-            # Create row
-            row_widths = [40, 250] + [200] * num_drivers + [80]
-            row_layout = cmds.rowLayout(numberOfColumns=len(row_widths), columnWidth=[(i+1, w) for i, w in enumerate(row_widths)])
+        row_widths = [40, 250] + [200] * num_drivers + [80]
+        
+        self.top_spacer = cmds.separator(height=1, style="none", manage=False)
+        
+        self.row_pool = []
+        for _ in range(self.row_pool_size):
+            slot = {'record': None}
+            slot['layout'] = cmds.rowLayout(
+                numberOfColumns=len(row_widths),
+                columnWidth=[(i+1, w) for i, w in enumerate(row_widths)],
+                height=self.row_height,
+                manage=False
+            )
             
             # Index
-            cmds.text(label=f"{idx+1}", align="center")
+            slot['index_text'] = cmds.text(label="", align="center")
             
             # Target control (non-editable)
-            cmds.textField(text=target_display, editable=False, backgroundColor=[0.2, 0.2, 0.2])
+            slot['target_field'] = cmds.textField(editable=False, backgroundColor=[0.2, 0.2, 0.2])
+            
+            # Driver control fields - every keystroke is written back to the bound record
+            slot['driver_fields'] = []
+            for i in range(num_drivers):
+                slot['driver_fields'].append(cmds.textField(
+                    textChangedCommand=lambda text, s=slot, i=i: self._on_driver_field_changed(s, i, text)
+                ))
+            
+            # Replace with Selection button - acts on whichever record is bound
+            cmds.button(label="Replace", command=lambda *args, s=slot: self.replace_with_selection(s['record']), backgroundColor=[0.4, 0.7, 0.5], annotation="Replace MISSING driver fields with current selection")
+            
+            cmds.setParent('..')
+            self.row_pool.append(slot)
+        
+        self.bottom_spacer = cmds.separator(height=1, style="none", manage=False)
+    
+    def _build_mapping_rows(self):
+        """Build a row record for each target control and show them all."""
+        self.mapping_rows = []
+        self._last_search_text = ''  # New rows are all visible
+        
+        # Rigs keep set order - sort for display only
+        mapping_items = sorted(self.connector.control_mapping.items(), key=lambda item: item[0].lower())
+        num_drivers = len(self.connector.drivers)
+        
+        for idx, (target_ctrl, driver_ctrls) in enumerate(mapping_items):
+            # Strip namespace for display
+            target_display = short_name(target_ctrl)
             
-            # Driver control fields
-            driver_fields = []
+            # Resolve the text shown in each driver field
+            driver_texts = []
             for i, driver_ctrl in enumerate(driver_ctrls):
                 driver_display = "MISSING"
                 
                 if driver_ctrl:
                     # Check if it exists as-is
                     if cmds.objExists(driver_ctrl):
-                        driver_display = driver_ctrl.split(':')[-1].split('|')[-1]
+                        driver_display = short_name(driver_ctrl)
                     else:
                         # Might be stored as short name, try to find full name
                         if i < len(self.connector.drivers):
                             driver = self.connector.drivers[i]
-                            for ctrl in driver.controls:
-                                ctrl_name = ctrl.split(':')[-1].split('|')[-1]
-                                if ctrl_name == driver_ctrl or ctrl == driver_ctrl:
-                                    driver_display = ctrl_name
-                                    break
+                            ctrl_name = short_name(driver_ctrl)
+                            full_name = driver.short_map.get(ctrl_name)
+                            if full_name and driver_ctrl in (ctrl_name, full_name):
+                                driver_display = ctrl_name
                 
-                field = cmds.textField(text=driver_display, annotation=f"Driver {i+1} control for {target_display}")
-                driver_fields.append(field)
+                driver_texts.append(driver_display)
+            
+            # One entry per driver field - the mapping may predate drivers added or removed since
+            driver_texts = driver_texts[:num_drivers] + ["MISSING"] * (num_drivers - len(driver_texts))
             
-            # Create row data first
+            # Pure data record - widgets are bound to it only while it is on screen
             row_data = {
+                'number': idx + 1,
                 'target_ctrl': target_ctrl,
                 'target_display': target_display,
-                'target_field': None,  # Not needed, it's read-only
-                'driver_fields': driver_fields,
+                'driver_texts': driver_texts,
                 'original_drivers': driver_ctrls,
-                'row_layout': row_layout,
-                'visible': True
+                'visible': True,
+                'target_display_cf': target_display.casefold(),
+                'original_drivers_cf': [short_name(d).casefold() for d in driver_ctrls if d],
+                '_haystack': None,  # Casefolded search text, None when stale
+                'has_missing': False
             }
+            row_data['_haystack'] = self._build_haystack(row_data)
+            self._recompute_missing(row_data)
             
-            # Replace with Selection button - use row_data directly
-            cmds.button(label="Replace", command=lambda *args, r=row_data: self.replace_with_selection(r), backgroundColor=[0.4, 0.7, 0.5], annotation="Replace MISSING driver fields with current selection")
+            self.mapping_rows.append(row_data)
+        
+        self._update_visible_rows()
+    
+    def _update_visible_rows(self):
+        """Collect the rows passing the current filter and redisplay from the top."""
+        self.visible_rows = [row for row in self.mapping_rows if row['visible']]
+        self._first_row = 0
+        cmds.scrollLayout(self.mapping_scroll, edit=True, scrollByPixel=("up", (len(self.mapping_rows) + 1) * self.row_height))
+        self._refresh_rows()
+    
+    def _on_scroll(self, *args):
+        """Rebind the row pool when the scrolled slice of rows changes."""
+        top = cmds.scrollLayout(self.mapping_scroll, query=True, scrollAreaValue=True)[0]
+        
+        # Keep a few pooled rows above the viewport as a buffer
+        first_row = max(0, min(top // self.row_height - 5, len(self.visible_rows) - self.row_pool_size))
+        if first_row != self._first_row:
+            self._first_row = first_row
+            self._refresh_rows()
+    
+    def _refresh_rows(self):
+        """Bind the pooled row widgets to the current slice of visible rows."""
+        count = len(self.visible_rows)
+        first = self._first_row
+        
+        cmds.columnLayout(self.rows_parent, edit=True, manage=False)
+        try:
+            self._set_spacer(self.top_spacer, first * self.row_height)
             
-            cmds.setParent('..')
+            for offset, slot in enumerate(self.row_pool):
+                index = first + offset
+                record = self.visible_rows[index] if index < count else None
+                if record is slot['record']:
+                    continue
+                
+                slot['record'] = record
+                if record is None:
+                    cmds.rowLayout(slot['layout'], edit=True, manage=False)
+                    continue
+                
+                self._bind_slot(slot)
+                cmds.rowLayout(slot['layout'], edit=True, manage=True)
             
-            # Add to list
-            self.mapping_rows.append(row_data)
+            self._set_spacer(self.bottom_spacer, max(0, count - first - self.row_pool_size) * self.row_height)
+        finally:
+            cmds.columnLayout(self.rows_parent, edit=True, manage=True)
+    
+    def _bind_slot(self, slot):
+        """Copy a record's values into a pooled row's widgets."""
+        record = slot['record']
+        cmds.text(slot['index_text'], edit=True, label=f"{record['number']}")
+        cmds.textField(slot['target_field'], edit=True, text=record['target_display'])
+        for i, field in enumerate(slot['driver_fields']):
+            cmds.textField(
+                field,
+                edit=True,
+                text=record['driver_texts'][i],
+                annotation=f"Driver {i+1} control for {record['target_display']}"
+            )
+    
+    def _set_spacer(self, spacer, height):
+        """Resize a spacer, hiding it when it has no height."""
+        if height > 0:
+            cmds.separator(spacer, edit=True, height=height, manage=True)
+        else:
+            cmds.separator(spacer, edit=True, manage=False)
+    
+    def _on_driver_field_changed(self, slot, index, text):
+        """Write an edited driver field back to the record bound to it."""
+        record = slot['record']
+        # Rebinding a slot sets the same text the record already holds
+        if record is not None and record['driver_texts'][index] != text:
+            record['driver_texts'][index] = text
+            self._invalidate_row(record)
+    
+    def _set_driver_text(self, row, index, text):
+        """Set a driver field value on a record and on its widget if it is on screen."""
+        row['driver_texts'][index] = text
+        self._invalidate_row(row)
+        for slot in self.row_pool:
+            if slot['record'] is row:
+                cmds.textField(slot['driver_fields'][index], edit=True, text=text)
+                break
+    
+    def _build_haystack(self, row):
+        """Build the casefolded search string for a row."""
+        parts = [row['target_display_cf']]
+        parts.extend(text.casefold() for text in row['driver_texts'])
+        parts.extend(row['original_drivers_cf'])
+        return "\n".join(parts)
+    
+    def _get_haystack(self, row):
+        """Return the cached search string for a row, rebuilding it if stale."""
+        if row['_haystack'] is None:
+            row['_haystack'] = self._build_haystack(row)
+        return row['_haystack']
+    
+    def _invalidate_row(self, row):
+        """Mark cached row data as stale after a driver field is edited."""
+        row['_haystack'] = None
+        self._last_search_text = None
+        self._recompute_missing(row)
+    
+    def _recompute_missing(self, row):
+        """Update the cached missing-driver flag from the row's driver values."""
+        row['has_missing'] = any(self._is_missing(text) for text in row['driver_texts'])
+    
+    def _is_missing(self, driver_text):
+        """Return True if a driver field value means no control is mapped."""
+        return driver_text == "MISSING" or not driver_text.strip()
     
     def replace_with_selection(self, row):
         """Replace MISSING driver fields with currently selected control."""
         if not row:
             return
         
-        selection = cmds.ls(selection=True)
+        selection = cmds.ls(selection=True, head=1)  # Only the first selected control is used
         if not selection:
             cmds.warning("Nothing selected. Please select a control first.")
             return
         
         selected_ctrl = selection[0]
-        ctrl_name = selected_ctrl.split(':')[-1].split('|')[-1]
+        ctrl_name = short_name(selected_ctrl)
         
         # Find which driver this control belongs to
         driver_index = None
@@ -1280,11 +1732,9 @@ class ControlMappingUI:
         
         if driver_index is not None:
             # Replace the field for this driver
-            if driver_index < len(row['driver_fields']):
-                field = row['driver_fields'][driver_index]
-                current_value = cmds.textField(field, query=True, text=True)
-                
-                cmds.textField(field, edit=True, text=ctrl_name)
+            if driver_index < len(row['driver_texts']):
+                current_value = row['driver_texts'][driver_index]
+                self._set_driver_text(row, driver_index, ctrl_name)
                 print(f"✓ Replaced '{current_value}' with '{ctrl_name}' in {row['target_display']} -> Driver {driver_index + 1}")
                 
                 cmds.inViewMessage(
@@ -1299,13 +1749,13 @@ class ControlMappingUI:
     
     def add_selection_to_search(self, *args):
         """Add selected control name to search field."""
-        selection = cmds.ls(selection=True)
+        selection = cmds.ls(selection=True, head=1)  # Only the first selected control is used
         if not selection:
             cmds.warning("Nothing selected")
             return
         
         selected_ctrl = selection[0]
-        ctrl_name = selected_ctrl.split(':')[-1].split('|')[-1]
+        ctrl_name = short_name(selected_ctrl)
         
         # Set search field and trigger filter
         cmds.textField(self.search_field, edit=True, text=ctrl_name)
@@ -1327,14 +1777,7 @@ class ControlMappingUI:
         print("✓ Cleared all mappings")
     
     def _rebuild_rows(self):
-        """Rebuild the mapping rows."""
-        # Delete old rows
-        if cmds.columnLayout(self.mapping_column, exists=True):
-            children = cmds.columnLayout(self.mapping_column, query=True, childArray=True) or []
-            for child in children:
-                cmds.deleteUI(child)
-        
-        # Rebuild
+        """Rebuild the mapping rows (the pooled row widgets are reused)."""
         self._build_mapping_rows()
     
     def apply_mapping(self, *args):
@@ -1344,14 +1787,17 @@ class ControlMappingUI:
         # Store old mapping for comparison
         old_mapping = dict(self.connector.control_mapping)
         
+        # Reconnection plan: {target_ctrl: [valid driver controls]}
+        plan = {}
+        
         # Read new mappings from UI
         for row in self.mapping_rows:
             target_ctrl = row['target_ctrl']
             
-            # Read driver fields
+            # Read driver values
             new_drivers = []
-            for i, field in enumerate(row['driver_fields']):
-                driver_display = cmds.textField(field, query=True, text=True).strip()
+            for i, driver_text in enumerate(row['driver_texts']):
+                driver_display = driver_text.strip()
                 
                 if driver_display == "MISSING" or driver_display == "":
                     # Keep as None
@@ -1359,14 +1805,7 @@ class ControlMappingUI:
                 else:
                     # Try to find the control in the driver rig
                     driver = self.connector.drivers[i]
-                    found = None
-                    
-                    # Search in driver controls
-                    for ctrl in driver.controls:
-                        ctrl_name = ctrl.split(':')[-1].split('|')[-1]
-                        if ctrl_name == driver_display:
-                            found = ctrl
-                            break
+                    found = driver.short_map.get(driver_display)
                     
                     if found:
                         new_drivers.append(found)
@@ -1381,282 +1820,325 @@ class ControlMappingUI:
             
             # Update mapping
             self.connector.control_mapping[target_ctrl] = new_drivers
+            plan[target_ctrl] = [ctrl for ctrl in new_drivers if ctrl is not None]
         
         # Check if connection already exists
         if not self.connector.control_locator:
             # Try to find existing controller
             if cmds.objExists("rig_connector_CTRL"):
-                self.connector.control_locator = "rig_connector_CTRL"
+                self.connector.set_control_locator("rig_connector_CTRL")
                 print("Found existing rig_connector_CTRL")
             else:
                 print("✓ Applied control mapping")
-                cmds.confirmDialog(title="Success", message="Control mapping applied!\n\nNow click 'Connect Rigs' to connect with the new mapping.", button=["OK"])
+                self._show_message("Control mapping applied!\nNow click 'Connect Rigs' to connect with the new mapping.")
                 return
         
         if not cmds.objExists(self.connector.control_locator):
             print("✓ Applied control mapping (no active connection)")
-            cmds.confirmDialog(title="Success", message="Control mapping applied!\n\nNow click 'Connect Rigs' to connect with the new mapping.", button=["OK"])
+            self._show_message("Control mapping applied!\nNow click 'Connect Rigs' to connect with the new mapping.")
             return
         
-        # Reconnect changed controls
-        print("\n=== Reconnecting changed controls ===")
-        print(f"Comparing {len(self.connector.control_mapping)} controls")
+        # Reconnect changed controls - collect output and print it once at the end
+        log = ["\n=== Reconnecting changed controls ===", f"Comparing {len(self.connector.control_mapping)} controls"]
         changes_made = 0
         
-        for target_ctrl, new_drivers in self.connector.control_mapping.items():
-            old_drivers = old_mapping.get(target_ctrl, [])
-            
-            # Check if mapping changed
-            if old_drivers != new_drivers:
-                changes_made += 1
-                print(f"\nReconnecting: {target_ctrl.split(':')[-1]}")
-                print(f"  Old: {[d.split(':')[-1] if d else 'None' for d in old_drivers]}")
-                print(f"  New: {[d.split(':')[-1] if d else 'None' for d in new_drivers]}")
-                
-                # Remove old constraints for this control
-                self._remove_constraints_for_control(target_ctrl)
-                
-                # Remove old blend connections for this control
-                self._remove_blend_connections_for_control(target_ctrl)
-                
-                # Create new connections
-                valid_drivers = [ctrl for ctrl in new_drivers if ctrl is not None]
+        # Disable parallel evaluation and viewport refresh while rebuilding the graph
+        eval_mode = cmds.evaluationManager(query=True, mode=True)[0]
+        if eval_mode != 'off':
+            cmds.evaluationManager(mode='off')
+        cmds.refresh(suspend=True)
+        
+        # Collapse the whole reconnection into one undo step
+        cmds.undoInfo(openChunk=True)
+        try:
+            for target_ctrl, new_drivers in self.connector.control_mapping.items():
+                old_drivers = old_mapping.get(target_ctrl, [])
                 
-                if valid_drivers:
-                    # Create constraints for translate/rotate
-                    if self.connector.use_constraints:
-                        self.connector._create_constraints_for_control(target_ctrl, valid_drivers)
+                # Check if mapping changed
+                if old_drivers != new_drivers:
+                    changes_made += 1
+                    log.append(f"\nReconnecting: {short_name(target_ctrl)}")
+                    log.append(f"  Old: {[short_name(d) if d else 'None' for d in old_drivers]}")
+                    log.append(f"  New: {[short_name(d) if d else 'None' for d in new_drivers]}")
+                    
+                    # Remove old constraints for this control
+                    self._remove_constraints_for_control(target_ctrl, log)
                     
-                    # Create blend nodes for custom attributes
-                    self.connector._create_blend_connections_for_control(target_ctrl, valid_drivers)
+                    # Remove old blend connections for this control
+                    self._remove_blend_connections_for_control(target_ctrl, log)
                     
-                    print(f"✓ Reconnected {target_ctrl.split(':')[-1]} with {len(valid_drivers)} driver(s)")
+                    # Create new connections - every changed control was planned from a row
+                    valid_drivers = plan[target_ctrl]
+                    
+                    if valid_drivers:
+                        # Create constraints for translate/rotate
+                        if self.connector.use_constraints:
+                            self.connector._create_constraints_for_control(target_ctrl, valid_drivers)
+                        
+                        # Create blend nodes for custom attributes
+                        self.connector._create_blend_connections_for_control(target_ctrl, valid_drivers)
+                        
+                        log.append(f"✓ Reconnected {short_name(target_ctrl)} with {len(valid_drivers)} driver(s)")
+        finally:
+            cmds.undoInfo(closeChunk=True)
+            cmds.refresh(suspend=False)
+            if eval_mode != 'off':
+                cmds.evaluationManager(mode=eval_mode)
+            print("\n".join(log))
         
         if changes_made > 0:
             print(f"\n✓ Applied mapping and reconnected {changes_made} control(s)")
-            cmds.confirmDialog(title="Success", message=f"Control mapping applied and {changes_made} control(s) reconnected!", button=["OK"])
+            self._show_message(f"Control mapping applied and {changes_made} control(s) reconnected!")
         else:
             print("✓ No changes detected")
-            cmds.confirmDialog(title="Info", message="No mapping changes detected.", button=["OK"])
+            self._show_message("No mapping changes detected.")
+    
+    def _show_message(self, message):
+        """Show a non-blocking in-view message (confirmDialog is kept for errors and decisions)."""
+        cmds.inViewMessage(
+            amg=f"<hl>{message}</hl>".replace("\n", "<br>"),
+            pos='midCenter',
+            fade=True,
+            fadeStayTime=2000
+        )
     
-    def _remove_constraints_for_control(self, target_ctrl):
-        """Remove constraints affecting a specific control."""
-        # Get all constraints on the target control
-        constraints = cmds.listConnections(target_ctrl, type='constraint') or []
+    def _remove_constraints_for_control(self, target_ctrl, log=None):
+        """Remove constraints affecting a specific control (messages go to log if given)."""
+        write = log.append if log is not None else print
+        
+        # Use the constraints recorded at creation time
+        tracked = self.connector._rc_constraints_by_target.pop(target_ctrl, None)
+        if tracked is not None:
+            to_delete = sorted(tracked)
+        else:
+            # Not created by this connector (e.g. reopened scene) - query the scene
+            constraints = cmds.listConnections(target_ctrl, type='constraint') or []
+            
+            # Collect unique rig_connector constraints
+            to_delete = []
+            for constraint in constraints:
+                if 'rig_connector' in constraint and constraint not in to_delete:
+                    to_delete.append(constraint)
         
-        for constraint in constraints:
-            if 'rig_connector' in constraint:
-                try:
-                    # Remove from tracking list
-                    if constraint in self.connector.constraint_nodes:
-                        self.connector.constraint_nodes.remove(constraint)
-                    
-                    # Delete constraint
-                    if cmds.objExists(constraint):
-                        cmds.delete(constraint)
-                        print(f"  Removed constraint: {constraint}")
-                except Exception as e:
-                    print(f"  Warning: Could not remove constraint {constraint}: {e}")
+        if not to_delete:
+            return
+        
+        # Remove from tracking set in one pass
+        self.connector.constraint_nodes.difference_update(to_delete)
+        
+        # Delete all constraints in a single call
+        existing = [c for c in to_delete if cmds.objExists(c)]
+        if existing:
+            try:
+                cmds.delete(*existing)
+                for constraint in existing:
+                    write(f"  Removed constraint: {constraint}")
+            except Exception as e:
+                write(f"  Warning: Could not remove constraints {existing}: {e}")
     
-    def _remove_blend_connections_for_control(self, target_ctrl):
-        """Remove blend node connections for a specific control."""
+    def _remove_blend_connections_for_control(self, target_ctrl, log=None):
+        """Remove blend node connections for a specific control (messages go to log if given)."""
+        write = log.append if log is not None else print
+        
         try:
-            # Get keyable attributes
-            keyable_attrs = cmds.listAttr(target_ctrl, keyable=True, unlocked=True, visible=True) or []
+            # Get custom keyable attributes (cached per control across reapplies)
+            custom_attrs_cache = self.connector._custom_attrs_cache
+            if target_ctrl not in custom_attrs_cache:
+                keyable_attrs = cmds.listAttr(target_ctrl, keyable=True, unlocked=True, visible=True) or []
+                custom_attrs_cache[target_ctrl] = {attr for attr in keyable_attrs if attr not in STANDARD_ATTRS}
+            custom_attrs = custom_attrs_cache[target_ctrl]
             
-            # Filter to custom attributes
-            standard_attrs = ['tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'sx', 'sy', 'sz', 'v']
-            custom_attrs = [attr for attr in keyable_attrs if attr not in standard_attrs]
+            # Get all input connections to the control in one query: [dest, src, dest, src, ...]
+            pairs = cmds.listConnections(target_ctrl, source=True, destination=False, plugs=True, connections=True) or []
             
-            for attr in custom_attrs:
-                # Get input connections to this attribute
-                connections = cmds.listConnections(f"{target_ctrl}.{attr}", source=True, plugs=True, destination=False) or []
+            nodes_to_delete = []
+            for dest_plug, src_plug in zip(pairs[::2], pairs[1::2]):
+                if dest_plug.split('.', 1)[1] not in custom_attrs:
+                    continue
                 
-                for conn in connections:
-                    node = conn.split('.')[0]
-                    if 'rig_connector' in node:
-                        # Disconnect
-                        cmds.disconnectAttr(conn, f"{target_ctrl}.{attr}")
-                        print(f"  Disconnected: {conn} -> {target_ctrl}.{attr}")
-                        
-                        # Delete the node if it exists
-                        if cmds.objExists(node):
-                            # Remove from tracking
-                            if node in self.connector.blend_nodes:
-                                self.connector.blend_nodes.remove(node)
-                            
-                            cmds.delete(node)
+                node = src_plug.split('.', 1)[0]
+                if 'rig_connector' in node:
+                    # Disconnect
+                    cmds.disconnectAttr(src_plug, dest_plug)
+                    write(f"  Disconnected: {src_plug} -> {dest_plug}")
+                    
+                    if node not in nodes_to_delete:
+                        nodes_to_delete.append(node)
+            
+            # Remove from tracking and delete all blend nodes at once
+            self.connector.blend_nodes.difference_update(nodes_to_delete)
+            
+            existing = [node for node in nodes_to_delete if cmds.objExists(node)]
+            if existing:
+                cmds.delete(*existing)
         
         except Exception as e:
-            print(f"  Warning: Error removing blend connections for {target_ctrl}: {e}")
+            write(f"  Warning: Error removing blend connections for {target_ctrl}: {e}")
+    
+    def _schedule_filter(self, *args):
+        """Debounce search typing so filtering only runs once typing pauses."""
+        self._cancel_filter()
+        
+        # Timer runs off the main thread - hand the actual filter back to Maya
+        timer = threading.Timer(self.filter_delay, lambda: maya.utils.executeDeferred(self._run_scheduled_filter, timer))
+        self._filter_timer = timer
+        timer.start()
+    
+    def _cancel_filter(self):
+        """Drop a pending debounced filter, even one already handed to Maya."""
+        if self._filter_timer:
+            self._filter_timer.cancel()
+        self._filter_timer = None
+    
+    def _run_scheduled_filter(self, timer):
+        """Run a debounced filter unless it was cancelled or superseded."""
+        if timer is self._filter_timer:
+            self.filter_rows()
     
     def filter_rows(self, *args):
         """Filter rows based on search text - searches target and all driver controls."""
-        search_text = cmds.textField(self.search_field, query=True, text=True).lower().strip()
+        self._filter_timer = None
+        if not cmds.textField(self.search_field, exists=True):
+            return
         
-        for row in self.mapping_rows:
-            if not search_text:
-                # Show all if search is empty
-                self._show_row(row)
+        search_text = cmds.textField(self.search_field, query=True, text=True).strip()
+        
+        # Empty or too short searches show all rows
+        needle = search_text.casefold() if len(search_text) >= self.search_min_length else ''
+        
+        # Nothing to do if the effective search hasn't changed (e.g. focus changes)
+        last_search = self._last_search_text
+        if needle == last_search:
+            return
+        
+        # Appending to the previous search can only hide rows, so only visible rows need checking
+        if last_search and needle.startswith(last_search):
+            rows = [row for row in self.mapping_rows if row['visible']]
+        else:
+            rows = self.mapping_rows
+        self._last_search_text = needle
+        
+        if not needle:
+            for row in rows:
+                row['visible'] = True
+        else:
+            # Whitespace separated tokens must all match ("l_arm ctrl"). Each token is one
+            # substring test against the joined haystack of target, mapped driver fields
+            # and actual driver names
+            tokens = needle.split()
+            get_haystack = self._get_haystack
+            if len(tokens) == 1:
+                for row in rows:
+                    row['visible'] = needle in (row['_haystack'] or get_haystack(row))
             else:
-                # Check if search text matches target control
-                target_match = search_text in row['target_display'].lower()
-                
-                # Check if search text matches any driver control (including mapped ones)
-                driver_match = False
-                for field in row['driver_fields']:
-                    driver_text = cmds.textField(field, query=True, text=True).lower()
-                    if search_text in driver_text:
-                        driver_match = True
-                        break
-                
-                # Check actual driver control names in the rig
-                actual_driver_match = False
-                for driver_ctrl in row['original_drivers']:
-                    if driver_ctrl:
-                        driver_display = driver_ctrl.split(':')[-1].split('|')[-1].lower()
-                        if search_text in driver_display:
-                            actual_driver_match = True
-                            break
-                
-                if target_match or driver_match or actual_driver_match:
-                    self._show_row(row)
-                else:
-                    self._hide_row(row)
+                for row in rows:
+                    haystack = row['_haystack'] or get_haystack(row)
+                    row['visible'] = all(token in haystack for token in tokens)
+        
+        self._update_visible_rows()
     
     def show_all(self, *args):
         """Show all rows."""
+        # Clearing the field fires textChangedCommand - the rows are set directly below
         cmds.textField(self.search_field, edit=True, text="")
+        self._cancel_filter()
+        self._last_search_text = ''
         for row in self.mapping_rows:
-            self._show_row(row)
+            row['visible'] = True
+        self._update_visible_rows()
     
     def show_missing_only(self, *args):
         """Show only rows with missing driver controls."""
+        # Clearing the field fires textChangedCommand - cancel it so it can't show every row again
         cmds.textField(self.search_field, edit=True, text="")
-        
+        self._cancel_filter()
+        self._last_search_text = None
         for row in self.mapping_rows:
-            has_missing = False
-            for field in row['driver_fields']:
-                driver_text = cmds.textField(field, query=True, text=True)
-                if driver_text == "MISSING" or not driver_text.strip():
-                    has_missing = True
-                    break
-            
-            if has_missing:
-                self._show_row(row)
-            else:
-                self._hide_row(row)
-    
-    def _show_row(self, row):
-        """Show a mapping row."""
-        if cmds.rowLayout(row['row_layout'], exists=True):
-            cmds.rowLayout(row['row_layout'], edit=True, visible=True, manage=True)
-            row['visible'] = True
-    
-    def _hide_row(self, row):
-        """Hide a mapping row."""
-        if cmds.rowLayout(row['row_layout'], exists=True):
-            cmds.rowLayout(row['row_layout'], edit=True, visible=False, manage=False)
-            row['visible'] = False
+            row['visible'] = row['has_missing']
+        self._update_visible_rows()
     
     def add_selection_to_field(self, *args):
         """Add selected control to the currently focused driver field."""
-        selection = cmds.ls(selection=True)
+        selection = cmds.ls(selection=True, head=1)  # Only the first selected control is used
         if not selection:
             cmds.warning("Nothing selected. Please select a control first.")
             return
         
         selected_ctrl = selection[0]
-        ctrl_name = selected_ctrl.split(':')[-1].split('|')[-1]
+        ctrl_name = short_name(selected_ctrl)
         
-        # Try to find which field has focus by checking all text fields
-        focused_field = None
-        focused_row = None
-        focused_driver_index = None
-        
-        for row in self.mapping_rows:
-            for i, field in enumerate(row['driver_fields']):
-                if cmds.textField(field, exists=True):
-                    # Check if this field was recently edited or could accept the control
-                    focused_field = field
-                    focused_row = row
-                    focused_driver_index = i
-                    # Don't break - we want the last one that exists
-        
-        # If we found a field, use the most recently created one or ask user
-        if focused_field:
+        # Rows are plain records, so any row can accept the control
+        if self.mapping_rows:
             # For now, let's search for the control name in driver lists
             # and auto-assign to the matching driver if possible
             assigned = False
             
+            # Drivers that own the selected control (by full or short name)
+            driver_indices = sorted(
+                set(self._name_to_drivers.get(selected_ctrl, [])) | set(self._name_to_drivers.get(ctrl_name, []))
+            )
+            
             for row_idx, row in enumerate(self.mapping_rows):
                 target_name = row['target_display']
                 
                 # Check if selected control matches or is similar to target
-                for driver_idx, driver in enumerate(self.connector.drivers):
-                    if selected_ctrl in driver.controls or ctrl_name in [c.split(':')[-1] for c in driver.controls]:
-                        # Found it in this driver's control list
-                        if driver_idx < len(row['driver_fields']):
-                            cmds.textField(row['driver_fields'][driver_idx], edit=True, text=ctrl_name)
-                            print(f"✓ Assigned '{ctrl_name}' to {target_name} -> Driver {driver_idx + 1}")
-                            assigned = True
-                            
-                            # If this matches the target name, we're done
-                            if ctrl_name.lower() == target_name.lower():
-                                cmds.confirmDialog(
-                                    title="Control Added",
-                                    message=f"Added '{ctrl_name}' to matching target control '{target_name}'",
-                                    button=["OK"]
-                                )
-                                return
+                for driver_idx in driver_indices:
+                    # Found it in this driver's control list
+                    if driver_idx < len(row['driver_texts']):
+                        self._set_driver_text(row, driver_idx, ctrl_name)
+                        print(f"✓ Assigned '{ctrl_name}' to {target_name} -> Driver {driver_idx + 1}")
+                        assigned = True
+                        
+                        # If this matches the target name, we're done
+                        if ctrl_name.lower() == target_name.lower():
+                            self._show_message(f"Added '{ctrl_name}' to matching target control '{target_name}'")
+                            return
             
             if assigned:
-                cmds.confirmDialog(
-                    title="Control Added",
-                    message=f"Added '{ctrl_name}' to driver field(s)",
-                    button=["OK"]
-                )
+                self._show_message(f"Added '{ctrl_name}' to driver field(s)")
             else:
-                # Control not found in any driver, offer to add manually
-                result = cmds.promptDialog(
-                    title="Add Control",
-                    message=f"Which row should '{ctrl_name}' be added to?\n\nEnter row number (1-{len(self.mapping_rows)}):",
-                    button=["OK", "Cancel"],
-                    defaultButton="OK",
-                    cancelButton="Cancel",
-                    dismissString="Cancel"
-                )
+                # Control not found in any driver, let the user pick the row and driver in one dialog
+                self._picker_ctrl_name = ctrl_name
+                result = cmds.layoutDialog(title="Add Control", ui=self._build_row_driver_picker)
                 
-                if result == "OK":
-                    row_num_text = cmds.promptDialog(query=True, text=True)
-                    try:
-                        row_num = int(row_num_text) - 1
-                        if 0 <= row_num < len(self.mapping_rows):
-                            row = self.mapping_rows[row_num]
-                            
-                            # Ask which driver
-                            driver_result = cmds.promptDialog(
-                                title="Select Driver",
-                                message=f"Which driver field? (1-{len(row['driver_fields'])}):",
-                                button=["OK", "Cancel"],
-                                defaultButton="OK",
-                                cancelButton="Cancel",
-                                dismissString="Cancel"
-                            )
-                            
-                            if driver_result == "OK":
-                                driver_num_text = cmds.promptDialog(query=True, text=True)
-                                driver_num = int(driver_num_text) - 1
-                                if 0 <= driver_num < len(row['driver_fields']):
-                                    cmds.textField(row['driver_fields'][driver_num], edit=True, text=ctrl_name)
-                                    print(f"✓ Manually assigned '{ctrl_name}' to row {row_num + 1}, driver {driver_num + 1}")
-                        else:
-                            cmds.warning(f"Row number out of range: {row_num + 1}")
-                    except ValueError:
-                        cmds.warning("Invalid row number")
+                if result and ',' in result:
+                    row_num, driver_num = (int(value) for value in result.split(','))
+                    row = self.mapping_rows[row_num]
+                    if 0 <= driver_num < len(row['driver_texts']):
+                        self._set_driver_text(row, driver_num, ctrl_name)
+                        print(f"✓ Manually assigned '{ctrl_name}' to row {row_num + 1}, driver {driver_num + 1}")
         else:
             cmds.warning("No driver fields found")
     
+    def _build_row_driver_picker(self):
+        """Build the layoutDialog contents for picking a mapping row and driver field."""
+        form = cmds.setParent(query=True)
+        cmds.formLayout(form, edit=True, width=400)
+        column = cmds.columnLayout(adjustableColumn=True, rowSpacing=5)
+        
+        cmds.text(label=f"Which row and driver should '{self._picker_ctrl_name}' be added to?", align="left")
+        
+        row_menu = cmds.optionMenu(label="Row:")
+        for i, row in enumerate(self.mapping_rows):
+            cmds.menuItem(label=f"{i+1}: {row['target_display']}")
+        
+        driver_menu = cmds.optionMenu(label="Driver:")
+        for i in range(len(self.connector.drivers)):
+            cmds.menuItem(label=f"Driver {i+1}")
+        
+        # Dismiss with "row_idx,driver_idx" (optionMenu selection is 1-based)
+        def accept(*args):
+            row_idx = cmds.optionMenu(row_menu, query=True, select=True) - 1
+            driver_idx = cmds.optionMenu(driver_menu, query=True, select=True) - 1
+            cmds.layoutDialog(dismiss=f"{row_idx},{driver_idx}")
+        
+        cmds.rowLayout(numberOfColumns=2, columnWidth2=(195, 195))
+        cmds.button(label="OK", command=accept)
+        cmds.button(label="Cancel", command=lambda *args: cmds.layoutDialog(dismiss="Cancel"))
+        cmds.setParent('..')
+        
+        cmds.formLayout(form, edit=True, attachForm=[(column, 'top', 5), (column, 'left', 5), (column, 'right', 5), (column, 'bottom', 5)])
+    
     def save_mapping(self, *args):
         """Save control mapping to a JSON file."""
         filepath = cmds.fileDialog2(
@@ -1680,8 +2162,8 @@ class ControlMappingUI:
             target_ctrl = row['target_ctrl']
             driver_mappings = []
             
-            for field in row['driver_fields']:
-                driver_text = cmds.textField(field, query=True, text=True).strip()
+            for driver_text in row['driver_texts']:
+                driver_text = driver_text.strip()
                 if driver_text == "MISSING" or driver_text == "":
                     driver_mappings.append(None)
                 else:
@@ -1741,17 +2223,23 @@ class ControlMappingUI:
                 if target_ctrl in mappings:
                     driver_mappings = mappings[target_ctrl]
                     
-                    # Fill in driver fields
-                    for i, field in enumerate(row['driver_fields']):
+                    # Fill in driver values
+                    for i in range(len(row['driver_texts'])):
                         if i < len(driver_mappings):
                             driver_value = driver_mappings[i]
                             if driver_value is None or driver_value == "":
-                                cmds.textField(field, edit=True, text="MISSING")
+                                row['driver_texts'][i] = "MISSING"
                             else:
-                                cmds.textField(field, edit=True, text=driver_value)
+                                row['driver_texts'][i] = driver_value
                     
+                    self._invalidate_row(row)
                     loaded_count += 1
             
+            # Rebind the on-screen rows to show the loaded values
+            for slot in self.row_pool:
+                slot['record'] = None
+            self._refresh_rows()
+            
             print(f"✓ Loaded control mapping from: {filepath[0]}")
             print(f"✓ Loaded {loaded_count} control mappings")
             
@@ -1764,11 +2252,13 @@ class ControlMappingUI:
         except Exception as e:
             cmds.warning(f"Failed to load mapping: {e}")
             print(f"Error loading mapping: {e}")
-            import traceback
             traceback.print_exc()
     
     def close_window(self, *args):
         """Close the mapping window."""
+        self.mapping_rows = []
+        self.visible_rows = []
+        self.row_pool = []
         if cmds.window(self.window_name, exists=True):
             cmds.deleteUI(self.window_name, window=True)
 
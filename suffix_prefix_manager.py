@@ -1,10 +1,19 @@
 import maya.cmds as cmds
 import maya.mel as mel
+import re
+import sys
+from contextlib import contextmanager
 
 class SuffixPrefixManager:
     def __init__(self):
         self.window_name = "SuffixPrefixManagerUI"
         self.window_title = "Suffix/Prefix Manager"
+        self.verbose = False  # List every renamed object, not just the count
+        self.rename_shapes = True  # Let Maya rename shapes along with their transforms
+        # Runs of a repeated "_"-separated part: suffix version never merges the first part,
+        # prefix version collapses repeats anywhere (including the leading part)
+        self._dup_suffix_re = re.compile(r'(?<=_)([^_]*)(?:_\1)+(?![^_])')
+        self._dup_prefix_re = re.compile(r'(?<![^_])([^_]*)(?:_\1)+(?![^_])')
         
     def create_ui(self):
         # Delete existing window if it exists
@@ -52,13 +61,23 @@ class SuffixPrefixManager:
         
         cmds.rowLayout(numberOfColumns=3, columnWidth3=(120, 200, 60), parent=suffix_frame)
         cmds.text(label="Add Suffix:", align="right")
-        self.add_suffix_field = cmds.textField(text="_CON", placeholderText="e.g., _CON")
+        self._add_suffix_value = "_CON"
+        self.add_suffix_field = cmds.textField(
+            text=self._add_suffix_value,
+            placeholderText="e.g., _CON",
+            textChangedCommand=lambda v: setattr(self, '_add_suffix_value', v)
+        )
         cmds.button(label="Add", command=self.add_suffix)
         cmds.setParent('..')
         
         cmds.rowLayout(numberOfColumns=3, columnWidth3=(120, 200, 60), parent=suffix_frame)
         cmds.text(label="Remove Suffix:", align="right")
-        self.remove_suffix_field = cmds.textField(text="_CON", placeholderText="e.g., _CON")
+        self._remove_suffix_value = "_CON"
+        self.remove_suffix_field = cmds.textField(
+            text=self._remove_suffix_value,
+            placeholderText="e.g., _CON",
+            textChangedCommand=lambda v: setattr(self, '_remove_suffix_value', v)
+        )
         cmds.button(label="Remove", command=self.remove_suffix)
         cmds.setParent('..')
         
@@ -78,13 +97,23 @@ class SuffixPrefixManager:
         
         cmds.rowLayout(numberOfColumns=3, columnWidth3=(120, 200, 60), parent=prefix_frame)
         cmds.text(label="Add Prefix:", align="right")
-        self.add_prefix_field = cmds.textField(text="CTRL_", placeholderText="e.g., CTRL_")
+        self._add_prefix_value = "CTRL_"
+        self.add_prefix_field = cmds.textField(
+            text=self._add_prefix_value,
+            placeholderText="e.g., CTRL_",
+            textChangedCommand=lambda v: setattr(self, '_add_prefix_value', v)
+        )
         cmds.button(label="Add", command=self.add_prefix)
         cmds.setParent('..')
         
         cmds.rowLayout(numberOfColumns=3, columnWidth3=(120, 200, 60), parent=prefix_frame)
         cmds.text(label="Remove Prefix:", align="right")
-        self.remove_prefix_field = cmds.textField(text="CTRL_", placeholderText="e.g., CTRL_")
+        self._remove_prefix_value = "CTRL_"
+        self.remove_prefix_field = cmds.textField(
+            text=self._remove_prefix_value,
+            placeholderText="e.g., CTRL_",
+            textChangedCommand=lambda v: setattr(self, '_remove_prefix_value', v)
+        )
         cmds.button(label="Remove", command=self.remove_prefix)
         cmds.setParent('..')
         
@@ -121,12 +150,74 @@ class SuffixPrefixManager:
         cmds.showWindow(self.window)
         self.refresh_selection()
     
+    @contextmanager
+    def _batch_rename_ctx(self):
+        """Rename as one undo step with viewport refresh and parallel evaluation paused"""
+        eval_mode = cmds.evaluationManager(query=True, mode=True)[0]
+        if eval_mode != 'off':
+            cmds.evaluationManager(mode='off')
+        cmds.refresh(suspend=True)
+        cmds.undoInfo(openChunk=True)
+        try:
+            yield
+        finally:
+            cmds.undoInfo(closeChunk=True)
+            cmds.refresh(suspend=False)
+            if eval_mode != 'off':
+                cmds.evaluationManager(mode=eval_mode)
+    
+    def _apply_rename(self, transform_fn, done_message, nothing_message, pattern=None, recursive=False):
+        """Rename the selection with transform_fn(original_name) -> new name (None to skip)
+        
+        pattern optionally narrows the selection to matching names inside Maya first.
+        """
+        query = [pattern] if pattern else []
+        selection = cmds.ls(*query, selection=True, long=True, recursive=recursive)
+        if not selection:
+            if pattern and cmds.ls(selection=True):
+                print(nothing_message)
+                self.refresh_selection()
+            else:
+                cmds.warning("Nothing selected")
+            return
+        
+        # Short names come straight from Maya - only names that clash keep a partial path to strip
+        short_names = cmds.ls(*query, selection=True, recursive=recursive)
+        
+        # Work out every new name first, then rename only the objects that change
+        plan = []
+        # Deepest first - renaming a parent would invalidate its children's long paths
+        for obj, original_name in sorted(zip(selection, short_names), key=lambda pair: -pair[0].count('|')):
+            if '|' in original_name:
+                original_name = original_name.rpartition('|')[2]
+            new_name = transform_fn(original_name)
+            if new_name and new_name != original_name:  # Make sure we don't create empty names
+                plan.append((obj, original_name, new_name))
+        
+        renamed = []
+        with self._batch_rename_ctx():
+            for obj, original_name, new_name in plan:
+                try:
+                    cmds.rename(obj, new_name, ignoreShape=not self.rename_shapes)
+                    renamed.append(f"{original_name} -> {new_name}")
+                except Exception as e:
+                    cmds.warning(f"Could not rename {original_name}: {e}")
+        
+        if renamed:
+            print(f"{done_message} {len(renamed)} objects")
+            if self.verbose:
+                sys.stdout.write('\n'.join(f"  {item}" for item in renamed) + '\n')
+        else:
+            print(nothing_message)
+        
+        self.refresh_selection()
+    
     def refresh_selection(self, *args):
         """Refresh the selection display"""
         selection = cmds.ls(selection=True)
         if selection:
             selection_info = f"Selected {len(selection)} objects:\n"
-            selection_info += "\n".join([obj.split('|')[-1] for obj in selection[:10]])
+            selection_info += "\n".join([obj.rpartition('|')[2] for obj in selection[:10]])
             if len(selection) > 10:
                 selection_info += f"\n... and {len(selection) - 10} more"
         else:
@@ -136,265 +227,90 @@ class SuffixPrefixManager:
     
     def add_suffix(self, *args):
         """Add suffix to selected objects"""
-        suffix = cmds.textField(self.add_suffix_field, query=True, text=True)
+        suffix = self._add_suffix_value
         if not suffix:
             cmds.warning("Please enter a suffix to add")
             return
         
-        selection = cmds.ls(selection=True, long=True)
-        if not selection:
-            cmds.warning("Nothing selected")
-            return
-        
-        renamed = []
-        for obj in selection:
-            original_name = obj.split('|')[-1]
-            if not original_name.endswith(suffix):
-                new_name = original_name + suffix
-                try:
-                    result = cmds.rename(obj, new_name)
-                    renamed.append(f"{original_name} -> {new_name}")
-                except Exception as e:
-                    cmds.warning(f"Could not rename {original_name}: {e}")
-        
-        if renamed:
-            print(f"Added suffix '{suffix}' to {len(renamed)} objects:")
-            for item in renamed:
-                print(f"  {item}")
-        else:
-            print(f"No objects needed suffix '{suffix}' added")
-        
-        self.refresh_selection()
+        self._apply_rename(
+            lambda name: None if name.endswith(suffix) else name + suffix,
+            f"Added suffix '{suffix}' to",
+            f"No objects needed suffix '{suffix}' added"
+        )
     
     def remove_suffix(self, *args):
         """Remove specific suffix from selected objects"""
-        suffix = cmds.textField(self.remove_suffix_field, query=True, text=True)
+        suffix = self._remove_suffix_value
         if not suffix:
             cmds.warning("Please enter a suffix to remove")
             return
         
-        selection = cmds.ls(selection=True, long=True)
-        if not selection:
-            cmds.warning("Nothing selected")
-            return
-        
-        renamed = []
-        for obj in selection:
-            original_name = obj.split('|')[-1]
-            if original_name.endswith(suffix):
-                new_name = original_name[:-len(suffix)]
-                if new_name:  # Make sure we don't create empty names
-                    try:
-                        result = cmds.rename(obj, new_name)
-                        renamed.append(f"{original_name} -> {new_name}")
-                    except Exception as e:
-                        cmds.warning(f"Could not rename {original_name}: {e}")
-        
-        if renamed:
-            print(f"Removed suffix '{suffix}' from {len(renamed)} objects:")
-            for item in renamed:
-                print(f"  {item}")
-        else:
-            print(f"No objects had suffix '{suffix}' to remove")
-        
-        self.refresh_selection()
+        self._apply_rename(
+            lambda name: name[:-len(suffix)] if name.endswith(suffix) else None,
+            f"Removed suffix '{suffix}' from",
+            f"No objects had suffix '{suffix}' to remove",
+            pattern=f"*{suffix}",
+            recursive=True  # Suffixes also apply to namespaced nodes
+        )
     
     def add_prefix(self, *args):
         """Add prefix to selected objects"""
-        prefix = cmds.textField(self.add_prefix_field, query=True, text=True)
+        prefix = self._add_prefix_value
         if not prefix:
             cmds.warning("Please enter a prefix to add")
             return
         
-        selection = cmds.ls(selection=True, long=True)
-        if not selection:
-            cmds.warning("Nothing selected")
-            return
-        
-        renamed = []
-        for obj in selection:
-            original_name = obj.split('|')[-1]
-            if not original_name.startswith(prefix):
-                new_name = prefix + original_name
-                try:
-                    result = cmds.rename(obj, new_name)
-                    renamed.append(f"{original_name} -> {new_name}")
-                except Exception as e:
-                    cmds.warning(f"Could not rename {original_name}: {e}")
-        
-        if renamed:
-            print(f"Added prefix '{prefix}' to {len(renamed)} objects:")
-            for item in renamed:
-                print(f"  {item}")
-        else:
-            print(f"No objects needed prefix '{prefix}' added")
-        
-        self.refresh_selection()
+        self._apply_rename(
+            lambda name: None if name.startswith(prefix) else prefix + name,
+            f"Added prefix '{prefix}' to",
+            f"No objects needed prefix '{prefix}' added"
+        )
     
     def remove_prefix(self, *args):
         """Remove specific prefix from selected objects"""
-        prefix = cmds.textField(self.remove_prefix_field, query=True, text=True)
+        prefix = self._remove_prefix_value
         if not prefix:
             cmds.warning("Please enter a prefix to remove")
             return
         
-        selection = cmds.ls(selection=True, long=True)
-        if not selection:
-            cmds.warning("Nothing selected")
-            return
-        
-        renamed = []
-        for obj in selection:
-            original_name = obj.split('|')[-1]
-            if original_name.startswith(prefix):
-                new_name = original_name[len(prefix):]
-                if new_name:  # Make sure we don't create empty names
-                    try:
-                        result = cmds.rename(obj, new_name)
-                        renamed.append(f"{original_name} -> {new_name}")
-                    except Exception as e:
-                        cmds.warning(f"Could not rename {original_name}: {e}")
-        
-        if renamed:
-            print(f"Removed prefix '{prefix}' from {len(renamed)} objects:")
-            for item in renamed:
-                print(f"  {item}")
-        else:
-            print(f"No objects had prefix '{prefix}' to remove")
-        
-        self.refresh_selection()
+        self._apply_rename(
+            lambda name: name[len(prefix):] if name.startswith(prefix) else None,
+            f"Removed prefix '{prefix}' from",
+            f"No objects had prefix '{prefix}' to remove",
+            pattern=f"{prefix}*"
+        )
     
     def remove_all_suffixes(self, *args):
         """Remove everything after the last underscore"""
-        selection = cmds.ls(selection=True, long=True)
-        if not selection:
-            cmds.warning("Nothing selected")
-            return
-        
-        renamed = []
-        for obj in selection:
-            original_name = obj.split('|')[-1]
-            if '_' in original_name:
-                new_name = original_name.rsplit('_', 1)[0]  # Remove everything after last _
-                if new_name and new_name != original_name:
-                    try:
-                        result = cmds.rename(obj, new_name)
-                        renamed.append(f"{original_name} -> {new_name}")
-                    except Exception as e:
-                        cmds.warning(f"Could not rename {original_name}: {e}")
-        
-        if renamed:
-            print(f"Removed all suffixes from {len(renamed)} objects:")
-            for item in renamed:
-                print(f"  {item}")
-        else:
-            print("No objects had suffixes to remove")
-        
-        self.refresh_selection()
+        self._apply_rename(
+            lambda name: name.rsplit('_', 1)[0] if '_' in name else None,
+            "Removed all suffixes from",
+            "No objects had suffixes to remove"
+        )
     
     def remove_all_prefixes(self, *args):
         """Remove everything before the first underscore"""
-        selection = cmds.ls(selection=True, long=True)
-        if not selection:
-            cmds.warning("Nothing selected")
-            return
-        
-        renamed = []
-        for obj in selection:
-            original_name = obj.split('|')[-1]
-            if '_' in original_name:
-                new_name = original_name.split('_', 1)[1]  # Remove everything before first _
-                if new_name and new_name != original_name:
-                    try:
-                        result = cmds.rename(obj, new_name)
-                        renamed.append(f"{original_name} -> {new_name}")
-                    except Exception as e:
-                        cmds.warning(f"Could not rename {original_name}: {e}")
-        
-        if renamed:
-            print(f"Removed all prefixes from {len(renamed)} objects:")
-            for item in renamed:
-                print(f"  {item}")
-        else:
-            print("No objects had prefixes to remove")
-        
-        self.refresh_selection()
+        self._apply_rename(
+            lambda name: name.split('_', 1)[1] if '_' in name else None,
+            "Removed all prefixes from",
+            "No objects had prefixes to remove"
+        )
     
     def clean_duplicate_suffixes(self, *args):
         """Remove duplicate suffixes (like _CON_CON_CON -> _CON)"""
-        selection = cmds.ls(selection=True, long=True)
-        if not selection:
-            cmds.warning("Nothing selected")
-            return
-        
-        renamed = []
-        for obj in selection:
-            original_name = obj.split('|')[-1]
-            parts = original_name.split('_')
-            if len(parts) > 1:
-                # Find the last unique part
-                base_name = parts[0]
-                last_suffix = None
-                
-                # Build name removing duplicate suffixes
-                for i, part in enumerate(parts[1:], 1):
-                    if part != last_suffix:
-                        base_name += '_' + part
-                        last_suffix = part
-                
-                if base_name != original_name:
-                    try:
-                        result = cmds.rename(obj, base_name)
-                        renamed.append(f"{original_name} -> {base_name}")
-                    except Exception as e:
-                        cmds.warning(f"Could not rename {original_name}: {e}")
-        
-        if renamed:
-            print(f"Cleaned duplicate suffixes from {len(renamed)} objects:")
-            for item in renamed:
-                print(f"  {item}")
-        else:
-            print("No duplicate suffixes found")
-        
-        self.refresh_selection()
+        self._apply_rename(
+            lambda name: self._dup_suffix_re.sub(r'\1', name),
+            "Cleaned duplicate suffixes from",
+            "No duplicate suffixes found"
+        )
     
     def clean_duplicate_prefixes(self, *args):
         """Remove duplicate prefixes (like CTRL_CTRL_object -> CTRL_object)"""
-        selection = cmds.ls(selection=True, long=True)
-        if not selection:
-            cmds.warning("Nothing selected")
-            return
-        
-        renamed = []
-        for obj in selection:
-            original_name = obj.split('|')[-1]
-            parts = original_name.split('_')
-            if len(parts) > 1:
-                # Remove duplicate prefixes from the beginning
-                cleaned_parts = []
-                last_part = None
-                
-                for part in parts:
-                    if part != last_part or len(cleaned_parts) == 0:
-                        cleaned_parts.append(part)
-                        last_part = part
-                
-                new_name = '_'.join(cleaned_parts)
-                if new_name != original_name:
-                    try:
-                        result = cmds.rename(obj, new_name)
-                        renamed.append(f"{original_name} -> {new_name}")
-                    except Exception as e:
-                        cmds.warning(f"Could not rename {original_name}: {e}")
-        
-        if renamed:
-            print(f"Cleaned duplicate prefixes from {len(renamed)} objects:")
-            for item in renamed:
-                print(f"  {item}")
-        else:
-            print("No duplicate prefixes found")
-        
-        self.refresh_selection()
+        self._apply_rename(
+            lambda name: self._dup_prefix_re.sub(r'\1', name),
+            "Cleaned duplicate prefixes from",
+            "No duplicate prefixes found"
+        )
     
     def close_window(self, *args):
         """Close the window"""